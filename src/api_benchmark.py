@@ -0,0 +1,179 @@
+"""
+Load benchmark for the api_utils fetchers against FakeApiServer.
+
+Run as a script (python src/api_benchmark.py --concurrency 16) or call
+run_benchmark() to get throughput and tail latency for each fetcher.
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from . import api_utils
+    from .fake_api_server import FakeApiServer
+except ImportError:  # imported with src/ on sys.path, as in the notebooks
+    import api_utils
+    from fake_api_server import FakeApiServer
+
+# Fetcher name -> call exercising it once
+DEFAULT_FETCHERS: Dict[str, Callable[[], Any]] = {
+    "get_joke": lambda: api_utils.get_joke(),
+    "get_dog_images": lambda: api_utils.get_dog_images(10),
+    "get_weather": lambda: api_utils.get_weather("Paris", "demo-key"),
+    "get_cat_facts": lambda: api_utils.get_cat_facts(limit=10, page=1),
+    "get_crypto_prices": lambda: api_utils.get_crypto_prices(["bitcoin", "ethereum"]),
+    "nasa_image_search": lambda: api_utils.nasa_image_search(
+        "moon", limit=5, per_host_rate=10_000
+    ),
+}
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = int(fraction * len(sorted_values) + 0.5)
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+def _succeeded(result: Any) -> bool:
+    """Fetchers signal failure with None, (None, None) or an empty list"""
+    return result not in (None, [], {}, (None, None))
+
+
+def benchmark_fetcher(
+    fetch: Callable[[], Any], calls: int = 100, concurrency: int = 8
+) -> Dict[str, float]:
+    """Run fetch `calls` times on `concurrency` threads and summarize"""
+
+    def timed_call(_) -> tuple:
+        start = time.perf_counter()
+        try:
+            ok = _succeeded(fetch())
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed_call, range(calls)))
+    wall = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        "calls": calls,
+        "failures": sum(1 for _, ok in results if not ok),
+        "seconds": wall,
+        "throughput": calls / wall if wall else 0.0,
+        "p50": _percentile(latencies, 0.50),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+        "max": latencies[-1] if latencies else 0.0,
+    }
+
+
+@contextmanager
+def _isolated_api_state(concurrency: int):
+    """Give the benchmark its own session with every shortcut turned off
+
+    Single-flight, price batching and the response cache would otherwise
+    answer most of the identical benchmark calls without a request. The
+    caller's session, pool settings and those switches are put back after.
+    """
+    with api_utils._session_lock:
+        saved_session = api_utils._session
+        saved_config = dict(api_utils._session_config)
+        api_utils._session = None
+    saved_cache = api_utils._response_cache
+    saved_flight = api_utils._single_flight
+    saved_batcher = api_utils._price_batcher
+
+    api_utils.disable_response_cache()
+    api_utils.disable_single_flight()
+    api_utils.disable_price_batching()
+    api_utils.configure_session(pool_maxsize=max(10, concurrency))
+    try:
+        yield
+    finally:
+        with api_utils._session_lock:
+            api_utils._close_session_locked()
+            api_utils._session = saved_session
+            api_utils._session_config.clear()
+            api_utils._session_config.update(saved_config)
+        api_utils._response_cache = saved_cache
+        api_utils._single_flight = saved_flight
+        api_utils._price_batcher = saved_batcher
+
+
+def run_benchmark(
+    fetchers: Optional[Dict[str, Callable[[], Any]]] = None,
+    calls: int = 100,
+    concurrency: int = 8,
+    **server_options,
+) -> Dict[str, Dict[str, float]]:
+    """Benchmark each fetcher against a fresh FakeApiServer
+
+    server_options are passed to FakeApiServer (latency, error_rate,
+    nasa_page_bytes, ...). Request coalescing and caching are off for the
+    run so every call reaches the server; the caller's settings are restored.
+    """
+    if fetchers is None:
+        fetchers = DEFAULT_FETCHERS
+
+    results = {}
+    with FakeApiServer(**server_options) as server, server.patch_module(api_utils):
+        with _isolated_api_state(concurrency):
+            api_utils.reset_circuit_breakers()
+            try:
+                for name, fetch in fetchers.items():
+                    results[name] = benchmark_fetcher(fetch, calls, concurrency)
+            finally:
+                api_utils.reset_circuit_breakers()
+    return results
+
+
+def format_report(results: Dict[str, Dict[str, float]]) -> str:
+    """Render benchmark results as a fixed-width table"""
+    header = (
+        f"{'fetcher':<20}{'calls':>7}{'fail':>6}{'req/s':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, stats in results.items():
+        lines.append(
+            f"{name:<20}{stats['calls']:>7}{stats['failures']:>6}"
+            f"{stats['throughput']:>10.1f}{stats['p50'] * 1000:>10.1f}"
+            f"{stats['p95'] * 1000:>10.1f}{stats['p99'] * 1000:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fetcher", action="append", choices=sorted(DEFAULT_FETCHERS))
+    args = parser.parse_args(argv)
+
+    fetchers = DEFAULT_FETCHERS
+    if args.fetcher:
+        fetchers = {name: DEFAULT_FETCHERS[name] for name in args.fetcher}
+
+    results = run_benchmark(
+        fetchers,
+        calls=args.calls,
+        concurrency=args.concurrency,
+        latency=args.latency,
+        error_rate=args.error_rate,
+    )
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
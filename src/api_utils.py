@@ -1,22 +1,1247 @@
-import requests
-import pandas as pd
+from __future__ import annotations
+
 import time
+import atexit
+import codecs
+import gzip
+import hashlib
+import importlib
+import io
+import json
+import math
+import os
+import random
+import struct
+import threading
+import weakref
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 from datetime import datetime
-from bs4 import BeautifulSoup
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
 import logging
-from typing import List, Dict, Optional, Tuple, Any
+from typing import (
+    List,
+    Dict,
+    Optional,
+    Tuple,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# requests, asyncio and ssl take ~200 ms to import; callers that only read
+# stored data or never go async should not pay for them
+requests = _LazyModule("requests")
+asyncio = _LazyModule("asyncio")
+ssl = _LazyModule("ssl")
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upstream endpoints used by the fetchers
+JOKE_API_URL = "https://official-joke-api.appspot.com/random_joke"
+DOG_API_URL = "https://dog.ceo/api/breeds/image/random"
+WEATHER_API_URL = "https://api.openweathermap.org/data/2.5/weather"
+CAT_FACTS_API_URL = "https://catfact.ninja/facts"
+CRYPTO_API_URL = "https://api.coingecko.com/api/v3/simple/price"
+NASA_API_URL = "https://images-api.nasa.gov/search"
+
+# Largest image count dog.ceo returns from a single random-image request
+DOG_MAX_PER_REQUEST = 50
+
+# Time spent in connect() (DNS + TCP + TLS) by the current thread's request
+_connect_timing = threading.local()
+
+
+# Classes deriving from requests/urllib3 types, defined on first use
+_http_types: Optional[SimpleNamespace] = None
+_http_types_lock = threading.Lock()
+
+
+def _get_http_types() -> SimpleNamespace:
+    """Return the classes built on requests/urllib3, defining them once"""
+    global _http_types
+    with _http_types_lock:
+        if _http_types is None:
+            _http_types = _define_http_types()
+        return _http_types
+
+
+def _define_http_types() -> SimpleNamespace:
+    """Import requests/urllib3 and define the classes that subclass them"""
+    import urllib3
+
+    class CircuitOpenError(requests.exceptions.RequestException):
+        """Raised instead of sending a request while a host's breaker is open"""
+
+    class CassetteMissError(requests.exceptions.RequestException):
+        """Raised in replay mode for a request that was never recorded"""
+
+    class _TimedHTTPConnection(urllib3.connection.HTTPConnection):
+        """HTTPConnection that records how long connect() took"""
+
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                super().connect()
+            finally:
+                _connect_timing.seconds = (
+                    getattr(_connect_timing, "seconds", 0.0)
+                    + time.perf_counter()
+                    - start
+                )
+
+    class _TimedHTTPSConnection(urllib3.connection.HTTPSConnection):
+        """HTTPSConnection that records how long connect() took"""
+
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                super().connect()
+            finally:
+                _connect_timing.seconds = (
+                    getattr(_connect_timing, "seconds", 0.0)
+                    + time.perf_counter()
+                    - start
+                )
+
+    class _TimedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+        ConnectionCls = _TimedHTTPConnection
+
+    class _TimedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+        ConnectionCls = _TimedHTTPSConnection
+
+    class _TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+        """HTTPAdapter whose pools use the connect-timing connection classes"""
+
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": _TimedHTTPConnectionPool,
+                "https": _TimedHTTPSConnectionPool,
+            }
+
+    return SimpleNamespace(
+        CircuitOpenError=CircuitOpenError,
+        CassetteMissError=CassetteMissError,
+        TimedHTTPAdapter=_TimedHTTPAdapter,
+    )
+
+
+def __getattr__(name: str):
+    # Public exception classes are created together with the requests import
+    if name in ("CircuitOpenError", "CassetteMissError"):
+        return getattr(_get_http_types(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Shared HTTP session so repeated calls reuse pooled keep-alive connections
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_session_config = {"pool_connections": 10, "pool_maxsize": 10, "pool_block": False}
+
+
+def configure_session(
+    pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False
+) -> requests.Session:
+    """Configure connection pooling and (re)create the shared HTTP session
+
+    pool_connections is the number of per-host pools kept alive and
+    pool_maxsize the number of connections kept in each of them.
+    """
+    if pool_connections < 1 or pool_maxsize < 1:
+        raise ValueError("Pool sizes must be at least 1")
+
+    with _session_lock:
+        _session_config.update(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        _close_session_locked()
+        return _get_session_locked()
+
+
+def _get_session_locked() -> requests.Session:
+    """Return the shared session, creating it if needed (caller holds the lock)"""
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = _get_http_types().TimedHTTPAdapter(**_session_config)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        _session = session
+    return _session
+
+
+def _close_session_locked() -> None:
+    """Close the shared session if one is open (caller holds the lock)"""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+
+def get_session() -> requests.Session:
+    """Get the shared pooled HTTP session used by all fetchers"""
+    with _session_lock:
+        return _get_session_locked()
+
+
+def close_session() -> None:
+    """Close pooled connections; the next request opens a fresh session"""
+    with _session_lock:
+        _close_session_locked()
+
+
+atexit.register(close_session)
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    acquire() takes one token, sleeping until one is available.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, blocking as needed; returns the seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker (closed -> open -> half-open -> closed)
+
+    After failure_threshold consecutive failures the breaker opens and
+    requests fail fast. Once reset_timeout seconds have passed a single
+    probe request is let through; its outcome closes or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now"""
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    raise _get_http_types().CircuitOpenError(
+                        "Circuit open, failing fast"
+                    )
+                self.state = "half_open"
+
+            if self.state == "half_open":
+                if self._probe_in_flight:
+                    self.rejected += 1
+                    raise _get_http_types().CircuitOpenError(
+                        "Circuit half-open, probe in flight"
+                    )
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Close the breaker after a healthy response"""
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker when the threshold is reached"""
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Finish a request whose outcome says nothing about host health"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state, consecutive failures and fast-failed request count"""
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "rejected": self.rejected,
+            }
+
+
+class RetryPolicy:
+    """Retry settings: full-jitter exponential backoff that honors Retry-After"""
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+    ):
+        if max_retries < 0 or backoff_factor < 0:
+            raise ValueError("max_retries and backoff_factor must be >= 0")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+
+    def delay(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """Seconds to wait before retry number attempt + 1"""
+        retry_after = _parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        ceiling = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        return random.uniform(0, ceiling)
+
+
+def _parse_retry_after(response: requests.Response) -> Optional[float]:
+    """Retry-After header as seconds (delta-seconds or HTTP-date form)"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+_retry_policy = RetryPolicy()
+_retry_stats = {"retries": 0, "retried_requests": 0, "exhausted": 0}
+_breaker_settings = {"failure_threshold": 5, "reset_timeout": 30.0}
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def configure_retries(
+    max_retries: int = 2,
+    backoff_factor: float = 0.5,
+    max_backoff: float = 30.0,
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+) -> RetryPolicy:
+    """Set how make_api_request retries timeouts, connection errors and statuses"""
+    global _retry_policy
+    _retry_policy = RetryPolicy(
+        max_retries, backoff_factor, max_backoff, retry_statuses
+    )
+    return _retry_policy
+
+
+def configure_circuit_breaker(
+    failure_threshold: int = 5, reset_timeout: float = 30.0
+) -> None:
+    """Set breaker thresholds; existing per-host breakers are reset"""
+    if failure_threshold < 1 or reset_timeout < 0:
+        raise ValueError("failure_threshold must be >= 1 and reset_timeout >= 0")
+    _breaker_settings.update(
+        failure_threshold=failure_threshold, reset_timeout=reset_timeout
+    )
+    reset_circuit_breakers()
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all per-host breaker state"""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def get_circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every host's breaker"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {host: breaker.snapshot() for host, breaker in breakers.items()}
+
+
+def get_retry_stats() -> Dict[str, int]:
+    """Total retries sent, requests that needed any, and requests that gave up"""
+    with _breakers_lock:
+        return dict(_retry_stats)
+
+
+def _breaker_for(url: str) -> CircuitBreaker:
+    """The circuit breaker guarding url's host"""
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(**_breaker_settings)
+            _breakers[host] = breaker
+        return breaker
+
+
+def _count_retry(first: bool = False, exhausted: bool = False) -> None:
+    with _breakers_lock:
+        if exhausted:
+            _retry_stats["exhausted"] += 1
+            return
+        _retry_stats["retries"] += 1
+        if first:
+            _retry_stats["retried_requests"] += 1
+
+
+class LatencyHistogram:
+    """Fixed-size latency histogram with log-spaced buckets
+
+    Buckets grow by 10% from 0.1 ms to about 2 minutes, so percentiles are
+    accurate to roughly 10% and memory does not grow with request count.
+    """
+
+    _FIRST_BOUND = 0.0001
+    _GROWTH = 1.1
+    _BUCKETS = 150
+
+    def __init__(self):
+        self.counts = [0] * (self._BUCKETS + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Record one observation"""
+        if seconds <= self._FIRST_BOUND:
+            index = 0
+        else:
+            index = int(math.log(seconds / self._FIRST_BOUND, self._GROWTH)) + 1
+        self.counts[min(index, self._BUCKETS)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given quantile (0..1)"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                bound = self._FIRST_BOUND * (self._GROWTH**index)
+                return min(bound, self.max)
+        return self.max
+
+
+class ApiMetrics:
+    """Per-endpoint request counts, errors, bytes and latency breakdown"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def record(
+        self,
+        endpoint: str,
+        seconds: float,
+        connect_seconds: float = 0.0,
+        nbytes: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """Add one request; connect_seconds covers DNS + TCP/TLS connect"""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = {
+                    "requests": 0,
+                    "errors": {},
+                    "bytes": 0,
+                    "connect_seconds": 0.0,
+                    "transfer_seconds": 0.0,
+                    "latency": LatencyHistogram(),
+                }
+                self._endpoints[endpoint] = stats
+            stats["requests"] += 1
+            stats["bytes"] += nbytes
+            stats["connect_seconds"] += connect_seconds
+            stats["transfer_seconds"] += max(0.0, seconds - connect_seconds)
+            stats["latency"].add(seconds)
+            if error:
+                stats["errors"][error] = stats["errors"].get(error, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Plain-dict view of every endpoint, with p50/p95/p99 latency"""
+        with self._lock:
+            result = {}
+            for endpoint, stats in self._endpoints.items():
+                latency = stats["latency"]
+                result[endpoint] = {
+                    "requests": stats["requests"],
+                    "errors": dict(stats["errors"]),
+                    "bytes": stats["bytes"],
+                    "connect_seconds": stats["connect_seconds"],
+                    "transfer_seconds": stats["transfer_seconds"],
+                    "latency": {
+                        "mean": latency.total / latency.count if latency.count else 0.0,
+                        "p50": latency.percentile(0.50),
+                        "p95": latency.percentile(0.95),
+                        "p99": latency.percentile(0.99),
+                        "max": latency.max,
+                    },
+                }
+            return result
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Snapshot serialized as JSON"""
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True)
+
+    def reset(self) -> None:
+        """Drop everything recorded so far"""
+        with self._lock:
+            self._endpoints.clear()
+
+
+_metrics: Optional[ApiMetrics] = None
+
+
+def enable_metrics() -> ApiMetrics:
+    """Start recording request metrics and return the collector"""
+    global _metrics
+    if _metrics is None:
+        _metrics = ApiMetrics()
+    return _metrics
+
+
+def disable_metrics() -> None:
+    """Stop recording; instrumented paths fall back to a single None check"""
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> Optional[ApiMetrics]:
+    """The active metrics collector, or None when metrics are disabled"""
+    return _metrics
+
+
+def _endpoint_name(url: str) -> str:
+    """URL without its query string, used as the metrics key"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class Cassette:
+    """Recorded request/response pairs for offline, reproducible runs
+
+    In "record" mode every upstream response seen by make_api_request and
+    the NASA scraper is captured; save() writes them to one gzip file of
+    length-prefixed JSON headers and raw bodies. In "replay" mode the file
+    is loaded into memory and requests are answered from it with no network
+    access. Repeated identical requests replay their recordings in order,
+    then keep returning the last one.
+
+    Query parameters named in redact (API keys) are masked in the stored
+    URLs and left out of the lookup keys, so cassettes can be shared
+    without the credentials and replay with any key.
+    """
+
+    _MAGIC = b"APICASSETTE1\n"
+    _REDACTED = "REDACTED"
+
+    def __init__(
+        self, path: str, mode: str = "replay", redact: Iterable[str] = ("appid",)
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError("mode must be 'record' or 'replay'")
+        self.path = Path(path)
+        self.mode = mode
+        self.redact = frozenset(name.lower() for name in redact)
+        self._interactions: Dict[str, List[Dict]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.played = 0
+        self.misses = 0
+        if mode == "replay":
+            self.load()
+
+    def key(self, url: str, params: Optional[Dict] = None) -> str:
+        """Lookup key for a request, with redacted parameters masked"""
+        if params:
+            params = {
+                name: self._REDACTED if str(name).lower() in self.redact else value
+                for name, value in params.items()
+            }
+        return ResponseCache.make_key(self.redact_url(url), params)
+
+    def redact_url(self, url: str) -> str:
+        """url with the values of redacted query parameters masked"""
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        if not any(name.lower() in self.redact for name, _ in query):
+            return url
+        query = [
+            (name, self._REDACTED if name.lower() in self.redact else value)
+            for name, value in query
+        ]
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def record(self, key: str, response: requests.Response) -> Dict:
+        """Capture a fully read response under key and return the recording"""
+        interaction = {
+            "url": self.redact_url(response.url or ""),
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "content": response.content,
+        }
+        with self._lock:
+            self._interactions.setdefault(key, []).append(interaction)
+            self.recorded += 1
+        return interaction
+
+    def play(self, key: str, url: str, stream: bool = False) -> requests.Response:
+        """Rebuild the next recorded response for key"""
+        with self._lock:
+            recordings = self._interactions.get(key)
+            if not recordings:
+                self.misses += 1
+                raise _get_http_types().CassetteMissError(
+                    f"No recorded response for {self.redact_url(url)}"
+                )
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = min(cursor + 1, len(recordings) - 1)
+            self.played += 1
+            interaction = recordings[cursor]
+        return self.to_response(interaction, stream)
+
+    @staticmethod
+    def to_response(interaction: Dict, stream: bool = False) -> requests.Response:
+        """Build a requests.Response from a recording"""
+        response = requests.Response()
+        response.status_code = interaction["status_code"]
+        response.reason = interaction["reason"]
+        response.url = interaction["url"]
+        response.headers = requests.structures.CaseInsensitiveDict(
+            interaction["headers"]
+        )
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        if stream:
+            response.raw = io.BytesIO(interaction["content"])
+        else:
+            response._content = interaction["content"]
+            response._content_consumed = True
+        return response
+
+    def save(self) -> None:
+        """Write all recordings to the cassette file"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, gzip.open(self.path, "wb") as file:
+            file.write(self._MAGIC)
+            for key, recordings in self._interactions.items():
+                for interaction in recordings:
+                    meta = {k: v for k, v in interaction.items() if k != "content"}
+                    meta["key"] = key
+                    header = json.dumps(meta).encode("utf-8")
+                    body = interaction["content"]
+                    file.write(struct.pack(">II", len(header), len(body)))
+                    file.write(header)
+                    file.write(body)
+
+    def load(self) -> None:
+        """Read the cassette file into memory"""
+        with gzip.open(self.path, "rb") as file:
+            data = file.read()
+        if not data.startswith(self._MAGIC):
+            raise ValueError(f"{self.path} is not an API cassette")
+
+        view = memoryview(data)
+        offset = len(self._MAGIC)
+        interactions: Dict[str, List[Dict]] = {}
+        while offset < len(data):
+            header_size, body_size = struct.unpack_from(">II", view, offset)
+            offset += 8
+            meta = json.loads(bytes(view[offset : offset + header_size]))
+            offset += header_size
+            meta["content"] = bytes(view[offset : offset + body_size])
+            offset += body_size
+            interactions.setdefault(meta.pop("key"), []).append(meta)
+
+        with self._lock:
+            self._interactions = interactions
+            self._cursors = {}
+
+
+_cassette: Optional[Cassette] = None
+
+
+@contextmanager
+def use_cassette(
+    path: str, mode: str = "replay", redact: Iterable[str] = ("appid",)
+) -> Iterator[Cassette]:
+    """Record or replay all api_utils HTTP traffic within the block
+
+    Query parameters named in redact are kept out of the cassette file.
+    """
+    global _cassette
+    cassette = Cassette(path, mode, redact)
+    previous = _cassette
+    _cassette = cassette
+    try:
+        yield cassette
+    finally:
+        _cassette = previous
+        if mode == "record":
+            cassette.save()
+
+
+class ResponseCache:
+    """Two-tier (in-memory LRU + optional on-disk) cache for GET responses
+
+    Entries are keyed by URL plus normalized params. Each endpoint gets its
+    own TTL (longest matching URL prefix in `ttls`, else `default_ttl`); a TTL
+    of 0 disables caching for that endpoint. Stale entries that carry an
+    ETag or Last-Modified header are revalidated with a conditional request.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        cache_dir: Optional[str] = None,
+        default_ttl: float = 60,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.default_ttl = default_ttl
+        self.ttls = dict(default_cache_ttls() if ttls is None else ttls)
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stores = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """Stable cache key for a URL and its query params"""
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        raw = json.dumps([url, items], separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, url: str) -> float:
+        """TTL of the longest configured URL prefix matching url"""
+        matches = [prefix for prefix in self.ttls if url.startswith(prefix)]
+        if not matches:
+            return self.default_ttl
+        return self.ttls[max(matches, key=len)]
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up an entry (fresh or stale) in memory, then on disk"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Dict) -> None:
+        """Store an entry in both tiers"""
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+        with self._lock:
+            self.stores += 1
+
+    def clear(self) -> None:
+        """Drop all entries from both tiers"""
+        with self._lock:
+            self._entries.clear()
+        if self.cache_dir:
+            for path in self.cache_dir.glob("*.cache"):
+                path.unlink()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/revalidation counters and current memory-tier size"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "stores": self.stores,
+                "entries": len(self._entries),
+            }
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _remember(self, key: str, entry: Dict) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        if not self.cache_dir:
+            return None
+        path = self.cache_dir / f"{key}.cache"
+        try:
+            with path.open("rb") as file:
+                entry = json.loads(file.readline())
+                entry["content"] = file.read()
+            return entry
+        except (OSError, ValueError) as e:
+            if path.exists():
+                logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+            return None
+
+    def _write_disk(self, key: str, entry: Dict) -> None:
+        if not self.cache_dir:
+            return
+        meta = {k: v for k, v in entry.items() if k != "content"}
+        path = self.cache_dir / f"{key}.cache"
+        tmp_path = path.with_suffix(f".tmp{threading.get_ident()}")
+        try:
+            with tmp_path.open("wb") as file:
+                file.write(json.dumps(meta).encode("utf-8") + b"\n")
+                file.write(entry["content"])
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write cache file %s: %s", path, e)
+
+
+def default_cache_ttls() -> Dict[str, float]:
+    """Per-endpoint cache TTLs in seconds; 0 means never cache (random endpoints)
+
+    Built from the current endpoint constants so it follows them when they
+    are pointed at another server.
+    """
+    return {
+        JOKE_API_URL: 0,
+        DOG_API_URL: 0,
+        WEATHER_API_URL: 600,
+        CAT_FACTS_API_URL: 3600,
+        CRYPTO_API_URL: 30,
+        NASA_API_URL: 3600,
+    }
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def enable_response_cache(
+    cache_dir: Optional[str] = None,
+    max_entries: int = 256,
+    default_ttl: float = 60,
+    ttls: Optional[Dict[str, float]] = None,
+) -> ResponseCache:
+    """Turn on response caching for make_api_request and return the cache"""
+    global _response_cache
+    _response_cache = ResponseCache(
+        max_entries=max_entries,
+        cache_dir=cache_dir,
+        default_ttl=default_ttl,
+        ttls=ttls,
+    )
+    return _response_cache
+
+
+def disable_response_cache() -> None:
+    """Turn off response caching (on-disk entries are left in place)"""
+    global _response_cache
+    _response_cache = None
+
+
+def get_cache_stats() -> Optional[Dict[str, int]]:
+    """Counters of the active response cache, or None if caching is off"""
+    cache = _response_cache
+    return cache.stats() if cache else None
+
+
+def _response_from_entry(entry: Dict) -> requests.Response:
+    """Rebuild a requests.Response from a cache entry"""
+    response = requests.Response()
+    response.status_code = entry["status_code"]
+    response.url = entry["url"]
+    response.headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = entry["content"]
+    return response
+
+
+def _entry_from_response(response: requests.Response, ttl: float) -> Dict:
+    """Build a cache entry from a successful response"""
+    keep = ("content-type", "etag", "last-modified")
+    return {
+        "status_code": response.status_code,
+        "url": response.url,
+        "headers": {k: v for k, v in response.headers.items() if k.lower() in keep},
+        "content": response.content,
+        "expires_at": time.time() + ttl,
+    }
+
+
+def _send_once(
+    url: str, params: Optional[Dict], timeout: int, headers: Optional[Dict] = None
+) -> requests.Response:
+    """Send one GET through the shared session, recording metrics if enabled"""
+    metrics = _metrics
+    if metrics is None:
+        return _send_raw(url, params, timeout, headers)
+
+    _connect_timing.seconds = 0.0
+    start = time.perf_counter()
+    try:
+        response = _send_raw(url, params, timeout, headers)
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        metrics.record(
+            _endpoint_name(url),
+            elapsed,
+            _connect_timing.seconds,
+            error=type(e).__name__,
+        )
+        raise
+
+    elapsed = time.perf_counter() - start
+    error = f"HTTP {response.status_code}" if response.status_code >= 400 else None
+    metrics.record(
+        _endpoint_name(url),
+        elapsed,
+        _connect_timing.seconds,
+        len(response.content or b""),
+        error,
+    )
+    return response
+
+
+def _send_raw(
+    url: str, params: Optional[Dict], timeout: int, headers: Optional[Dict] = None
+) -> requests.Response:
+    """Send one GET through the shared session (or the active cassette)"""
+    cassette = _cassette
+    if cassette is not None and cassette.mode == "replay":
+        return cassette.play(cassette.key(url, params), url)
+
+    if headers:
+        response = get_session().get(
+            url, params=params, timeout=timeout, headers=headers
+        )
+    else:
+        response = get_session().get(url, params=params, timeout=timeout)
+
+    if cassette is not None:
+        cassette.record(cassette.key(url, params), response)
+    return response
+
+
+def _stream_get(url: str, timeout: int) -> requests.Response:
+    """Streamed GET for scraping; recording reads the whole body once"""
+    cassette = _cassette
+    if cassette is not None and cassette.mode == "replay":
+        return cassette.play(cassette.key(url), url, stream=True)
+
+    response = get_session().get(url, timeout=timeout, stream=True)
+    if cassette is not None:
+        interaction = cassette.record(cassette.key(url), response)
+        return cassette.to_response(interaction, stream=True)
+    return response
+
+
+def _send_request(
+    url: str, params: Optional[Dict], timeout: int, headers: Optional[Dict] = None
+) -> requests.Response:
+    """Send a GET with retries, guarded by the host's circuit breaker"""
+    breaker = _breaker_for(url)
+    policy = _retry_policy
+    attempt = 0
+
+    while True:
+        breaker.before_request()
+        try:
+            response = _send_once(url, params, timeout, headers)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            breaker.record_failure()
+            if attempt >= policy.max_retries:
+                if attempt:
+                    _count_retry(exhausted=True)
+                raise
+            delay = policy.delay(attempt)
+        except Exception:
+            breaker.release()
+            raise
+        else:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if response.status_code not in policy.retry_statuses:
+                return response
+            if attempt >= policy.max_retries:
+                if attempt:
+                    _count_retry(exhausted=True)
+                return response
+            delay = policy.delay(attempt, response)
+
+        _count_retry(first=attempt == 0)
+        attempt += 1
+        logger.warning("Retrying %s in %.2fs (attempt %d)", url, delay, attempt)
+        time.sleep(delay)
+
+
+def _cached_request(
+    cache: ResponseCache, url: str, params: Optional[Dict], timeout: int
+) -> requests.Response:
+    """Serve from cache when fresh, revalidate when stale, else fetch and store"""
+    ttl = cache.ttl_for(url)
+    if ttl <= 0:
+        return _send_request(url, params, timeout)
+
+    key = cache.make_key(url, params)
+    entry = cache.get(key)
+    if entry is not None and entry["expires_at"] > time.time():
+        cache._count("hits")
+        return _response_from_entry(entry)
+
+    conditional = {}
+    if entry is not None:
+        headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+        if "etag" in headers:
+            conditional["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditional["If-Modified-Since"] = headers["last-modified"]
+
+    response = _send_request(url, params, timeout, conditional or None)
+
+    if entry is not None and conditional and response.status_code == 304:
+        cache._count("revalidations")
+        entry = dict(entry, expires_at=time.time() + ttl)
+        cache.put(key, entry)
+        return _response_from_entry(entry)
+
+    cache._count("misses")
+    cache_control = response.headers.get("Cache-Control", "")
+    if response.status_code == 200 and "no-store" not in cache_control:
+        cache.put(key, _entry_from_response(response, ttl))
+    return response
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Dict] = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn() for key, or join the identical call already in flight"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = fn()
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+        return call["result"]
+
+
+class PriceBatcher:
+    """Merge concurrent price lookups for different coins into one ids= query
+
+    The first caller for a currency opens a batch and waits `window`
+    seconds; coins requested by other callers in the meantime join it (up to
+    max_ids per query). One request is sent and each caller receives only
+    the coins it asked for.
+    """
+
+    def __init__(self, window: float = 0.01, max_ids: int = 250):
+        if window < 0 or max_ids < 1:
+            raise ValueError("window must be >= 0 and max_ids at least 1")
+        self.window = window
+        self.max_ids = max_ids
+        self._lock = threading.Lock()
+        self._open: Dict[str, Dict] = {}
+        self.batches = 0
+        self.batched_calls = 0
+
+    def get(self, coins: List[str], currency: str = "usd") -> Optional[Dict]:
+        """Prices for coins, fetched as part of a shared batch"""
+        with self._lock:
+            batch = self._open.get(currency)
+            if batch is None or len(batch["ids"].union(coins)) > self.max_ids:
+                batch = {"ids": set(), "done": threading.Event(), "result": None}
+                self._open[currency] = batch
+                leader = True
+            else:
+                leader = False
+            batch["ids"].update(coins)
+            self.batched_calls += 1
+
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                # Close the batch so later callers start a new one
+                if self._open.get(currency) is batch:
+                    del self._open[currency]
+                ids = sorted(batch["ids"])
+                self.batches += 1
+            try:
+                batch["result"] = _fetch_crypto_prices(ids, currency)
+            finally:
+                batch["done"].set()
+        else:
+            batch["done"].wait()
+
+        result = batch["result"]
+        if result is None:
+            return None
+        return {coin: result[coin] for coin in coins if coin in result}
+
+
+_single_flight: Optional[SingleFlight] = SingleFlight()
+_price_batcher: Optional[PriceBatcher] = None
+
+
+def enable_single_flight() -> None:
+    """Coalesce identical in-flight requests in make_api_request (default)"""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+
+
+def disable_single_flight() -> None:
+    """Send every make_api_request call upstream on its own"""
+    global _single_flight
+    _single_flight = None
+
+
+def enable_price_batching(window: float = 0.01, max_ids: int = 250) -> PriceBatcher:
+    """Micro-batch concurrent get_crypto_prices calls into shared queries"""
+    global _price_batcher
+    _price_batcher = PriceBatcher(window=window, max_ids=max_ids)
+    return _price_batcher
+
+
+def disable_price_batching() -> None:
+    """Send one CoinGecko query per get_crypto_prices call (default)"""
+    global _price_batcher
+    _price_batcher = None
+
+
+def get_coalescing_stats() -> Dict[str, int]:
+    """How many calls were served by single-flight and by price batches"""
+    single_flight = _single_flight
+    batcher = _price_batcher
+    return {
+        "coalesced_requests": single_flight.coalesced if single_flight else 0,
+        "price_batches": batcher.batches if batcher else 0,
+        "batched_price_calls": batcher.batched_calls if batcher else 0,
+    }
+
+
+def _is_random_endpoint(url: str) -> bool:
+    """Random endpoints must not be coalesced: each caller expects its own result"""
+    return url.startswith((JOKE_API_URL, DOG_API_URL))
+
+
+def _fetch(url: str, params: Optional[Dict], timeout: int) -> requests.Response:
+    """Fetch through the response cache when it is enabled"""
+    cache = _response_cache
+    if cache is None:
+        return _send_request(url, params, timeout)
+    return _cached_request(cache, url, params, timeout)
+
 
 def make_api_request(
     url: str, params: Optional[Dict] = None, timeout: int = 5
 ) -> Optional[requests.Response]:
     """Make an API request with comprehensive error handling"""
     try:
-        response = requests.get(url, params=params, timeout=timeout)
+        single_flight = _single_flight
+        if single_flight is None or _is_random_endpoint(url):
+            response = _fetch(url, params, timeout)
+        else:
+            key = ResponseCache.make_key(url, params)
+            response = single_flight.do(key, lambda: _fetch(url, params, timeout))
         response.raise_for_status()
         return response
     except requests.exceptions.Timeout:
@@ -32,8 +1257,7 @@ def make_api_request(
 
 def get_joke() -> Tuple[Optional[str], Optional[str]]:
     """Get a random joke from the Official Joke API"""
-    url = "https://official-joke-api.appspot.com/random_joke"
-    response = make_api_request(url)
+    response = make_api_request(JOKE_API_URL)
 
     if response and response.status_code == 200:
         try:
@@ -46,11 +1270,18 @@ def get_joke() -> Tuple[Optional[str], Optional[str]]:
 
 
 def get_dog_images(count: int = 1) -> List[str]:
-    """Get random dog images from Dog CEO API"""
+    """Get random dog images from Dog CEO API
+
+    Counts above the upstream per-request cap are fetched in bulk mode
+    (see iter_dog_images).
+    """
     if count < 1:
         return []
 
-    url = f"https://dog.ceo/api/breeds/image/random/{count}"
+    if count > DOG_MAX_PER_REQUEST:
+        return list(iter_dog_images(count))
+
+    url = f"{DOG_API_URL}/{count}"
     response = make_api_request(url)
 
     if response and response.status_code == 200:
@@ -63,12 +1294,62 @@ def get_dog_images(count: int = 1) -> List[str]:
     return []
 
 
+def iter_dog_images(
+    count: int,
+    chunk_size: int = DOG_MAX_PER_REQUEST,
+    max_workers: int = 4,
+    max_stalled: int = 3,
+) -> Iterator[str]:
+    """Yield up to count unique dog image URLs as capped sub-requests complete
+
+    The count is split into sub-requests of at most chunk_size images, up to
+    max_workers of them in flight. Duplicates are dropped as they arrive and
+    the shortfall is re-requested. Generation stops early after max_stalled
+    consecutive sub-requests that bring nothing new (failures included).
+    """
+    if count < 1:
+        return
+
+    chunk_size = max(1, min(chunk_size, DOG_MAX_PER_REQUEST))
+    seen = set()
+    pending: Dict[Any, int] = {}
+    requested = 0
+    stalled = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while len(seen) < count and stalled < max_stalled:
+                while len(pending) < max_workers and len(seen) + requested < count:
+                    size = min(chunk_size, count - len(seen) - requested)
+                    pending[executor.submit(get_dog_images, size)] = size
+                    requested += size
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    requested -= pending.pop(future)
+                    new_images = 0
+                    for url in future.result():
+                        if url not in seen and len(seen) < count:
+                            seen.add(url)
+                            new_images += 1
+                            yield url
+                    stalled = 0 if new_images else stalled + 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+    if len(seen) < count:
+        logger.warning("Collected %d of %d requested dog images", len(seen), count)
+
+
 def get_weather(city: str, api_key: str) -> Optional[Dict]:
     """Get weather data from OpenWeatherMap API"""
-    url = "https://api.openweathermap.org/data/2.5/weather"
     params = {"q": city, "appid": api_key, "units": "metric"}
 
-    response = make_api_request(url, params=params)
+    response = make_api_request(WEATHER_API_URL, params=params)
 
     if response and response.status_code == 200:
         try:
@@ -79,12 +1360,99 @@ def get_weather(city: str, api_key: str) -> Optional[Dict]:
     return None
 
 
+# Per-city weather cache: (api_key, normalized city) -> (expires_at, payload)
+WEATHER_CACHE_TTL = 600  # OpenWeatherMap refreshes current weather ~every 10 min
+_weather_cache: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+_weather_cache_lock = threading.Lock()
+
+
+def clear_weather_cache() -> None:
+    """Forget all cached per-city weather"""
+    with _weather_cache_lock:
+        _weather_cache.clear()
+
+
+def _weather_or_error(
+    city: str, api_key: str, timeout: int = 5
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """Fetch one city's weather, returning (payload, None) or (None, reason)"""
+    params = {"q": city, "appid": api_key, "units": "metric"}
+    try:
+        response = _fetch(WEATHER_API_URL, params, timeout)
+        response.raise_for_status()
+        return response.json(), None
+    except (requests.exceptions.RequestException, ValueError) as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def get_weather_bulk(
+    cities: List[str],
+    api_key: str,
+    max_workers: int = 10,
+    ttl: float = WEATHER_CACHE_TTL,
+) -> Tuple[Dict[str, Dict], List[Dict[str, str]]]:
+    """Get weather for many cities concurrently, reusing per-city cached data
+
+    Returns (results, errors): results maps each city that succeeded to its
+    payload, errors lists {"city", "error"} for the ones that failed or are
+    blank. Cities are matched case-insensitively, so "Paris" and "paris" are
+    fetched once and both appear in the output; cached payloads are reused
+    for ttl seconds (0 disables the cache), only for the same api_key.
+    """
+    results: Dict[str, Dict] = {}
+    errors: List[Dict[str, str]] = []
+    keys: Dict[str, str] = {}  # input city -> normalized key
+    payloads: Dict[str, Dict] = {}
+    to_fetch: Dict[str, str] = {}  # key -> spelling sent upstream
+    now = time.time()
+
+    with _weather_cache_lock:
+        for city in cities:
+            if city in keys:
+                continue
+            key = city.strip().lower()
+            keys[city] = key
+            if not key or key in payloads or key in to_fetch:
+                continue
+            cached = _weather_cache.get((api_key, key))
+            if ttl > 0 and cached and cached[0] > now:
+                payloads[key] = cached[1]
+            else:
+                to_fetch[key] = city
+
+    failures: Dict[str, str] = {"": "Empty city name"}
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(
+                lambda city: _weather_or_error(city, api_key), to_fetch.values()
+            )
+            for key, (payload, error) in zip(to_fetch, outcomes):
+                if error is not None:
+                    failures[key] = error
+                    continue
+                payloads[key] = payload
+                if ttl > 0:
+                    with _weather_cache_lock:
+                        _weather_cache[api_key, key] = (time.time() + ttl, payload)
+
+    for city, key in keys.items():
+        if key in payloads:
+            results[city] = payloads[key]
+        else:
+            errors.append({"city": city, "error": failures[key]})
+
+    if errors:
+        logger.warning(
+            "Weather lookup failed for %d of %d cities", len(errors), len(cities)
+        )
+    return results, errors
+
+
 def get_cat_facts(limit: int = 10, page: int = 1) -> Optional[Dict]:
     """Get cat facts from Cat Facts API"""
-    url = "https://catfact.ninja/facts"
     params = {"limit": limit, "page": page}
 
-    response = make_api_request(url, params=params)
+    response = make_api_request(CAT_FACTS_API_URL, params=params)
 
     if response and response.status_code == 200:
         try:
@@ -100,10 +1468,17 @@ def get_crypto_prices(coins: List[str] = None, currency: str = "usd") -> Optiona
     if coins is None:
         coins = ["bitcoin", "ethereum"]
 
-    url = "https://api.coingecko.com/api/v3/simple/price"
+    batcher = _price_batcher
+    if batcher is not None:
+        return batcher.get(coins, currency)
+    return _fetch_crypto_prices(coins, currency)
+
+
+def _fetch_crypto_prices(coins: List[str], currency: str) -> Optional[Dict]:
+    """Query CoinGecko for exactly the given coins"""
     params = {"ids": ",".join(coins), "vs_currencies": currency}
 
-    response = make_api_request(url, params=params)
+    response = make_api_request(CRYPTO_API_URL, params=params)
 
     if response and response.status_code == 200:
         try:
@@ -114,29 +1489,273 @@ def get_crypto_prices(coins: List[str] = None, currency: str = "usd") -> Optiona
     return None
 
 
-def collect_cat_facts_dataset(target_count: int = 50) -> List[str]:
-    """Build a dataset of cat facts"""
+def _iter_cat_fact_pages(
+    first_page: int,
+    page_size: int,
+    max_in_flight: int,
+    requests_per_second: float,
+    still_needed: Callable[[], int],
+) -> Iterator[Tuple[int, List[str]]]:
+    """Yield (page, facts) in page order from a rate-limited concurrent window
+
+    New pages are only requested while still_needed() exceeds what the
+    in-flight pages are expected to bring. Iteration ends at the first empty
+    or failed page, or when nothing more is needed.
+    """
+    limiter = TokenBucket(requests_per_second)
+    pending = deque()
+    next_page = first_page
+
+    def fetch_page(page: int) -> Optional[Dict]:
+        limiter.acquire()
+        return get_cat_facts(limit=page_size, page=page)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        try:
+            while True:
+                # Keep the window full, but only with pages we still expect to need
+                while (
+                    len(pending) < max_in_flight
+                    and len(pending) * page_size < still_needed()
+                ):
+                    pending.append((next_page, executor.submit(fetch_page, next_page)))
+                    next_page += 1
+
+                if not pending:
+                    return
+
+                page, future = pending.popleft()
+                data = future.result()
+
+                if data and "data" in data:
+                    facts = [fact["fact"] for fact in data["data"] if "fact" in fact]
+                    yield page, facts
+
+                    if len(facts) == 0:  # No more facts available
+                        return
+                else:
+                    logger.error("Error on page %d", page)
+                    return
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def collect_cat_facts_dataset(
+    target_count: int = 50,
+    max_in_flight: int = 4,
+    requests_per_second: float = 1.0,
+    page_size: int = 10,
+) -> List[str]:
+    """Build a dataset of cat facts
+
+    Pages are fetched concurrently (at most max_in_flight at once) while a
+    token bucket caps the request rate; results are kept in page order and
+    collection stops at the first empty page.
+    """
+    if target_count < 1:
+        return []
+
     facts_list = []
-    page = 1
+    pages = _iter_cat_fact_pages(
+        1,
+        page_size,
+        max_in_flight,
+        requests_per_second,
+        lambda: target_count - len(facts_list),
+    )
+    for page, facts in pages:
+        facts_list.extend(facts)
+        logger.info("Page %d: Collected %d facts so far.", page, len(facts_list))
+
+    return facts_list[:target_count]  # Ensure we don't exceed target
+
 
-    while len(facts_list) < target_count:
-        data = get_cat_facts(limit=min(10, target_count - len(facts_list)), page=page)
+def _fact_digest(fact: str) -> bytes:
+    """Content hash used to deduplicate facts (whitespace/case-insensitive)"""
+    normalized = " ".join(fact.split()).lower()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
 
-        if data and "data" in data:
-            facts = [fact["fact"] for fact in data["data"] if "fact" in fact]
-            facts_list.extend(facts)
-            logger.info("Page %d: Collected %d facts so far.", page, len(facts_list))
 
-            if len(facts) == 0:  # No more facts available
+def _load_fact_store(facts_path: Path) -> set:
+    """Digests of every stored fact; repairs a torn final line first"""
+    digests = set()
+    if not facts_path.exists():
+        return digests
+
+    good_size = 0
+    with facts_path.open("rb") as file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break  # torn write from an interrupted run
+            try:
+                digests.add(bytes.fromhex(json.loads(line)["hash"]))
+            except (ValueError, KeyError):
                 break
+            good_size += len(line)
+
+    if good_size < facts_path.stat().st_size:
+        logger.warning("Truncating damaged tail of %s", facts_path)
+        with facts_path.open("r+b") as file:
+            file.truncate(good_size)
+    return digests
+
+
+def iter_stored_cat_facts(store_dir: str) -> Iterator[str]:
+    """Stream facts saved by collect_cat_facts_to_disk, one at a time"""
+    facts_path = Path(store_dir) / "facts.jsonl"
+    if not facts_path.exists():
+        return
+    with facts_path.open("r", encoding="utf-8") as file:
+        for line in file:
+            if line.endswith("\n"):
+                yield json.loads(line)["fact"]
 
-            page += 1
-            time.sleep(1)  # Respect rate limits
+
+def collect_cat_facts_to_disk(
+    target_count: int,
+    store_dir: str,
+    max_in_flight: int = 4,
+    requests_per_second: float = 1.0,
+    page_size: int = 10,
+) -> int:
+    """Collect cat facts into a resumable, deduplicated on-disk store
+
+    New facts are appended to store_dir/facts.jsonl as each page arrives and
+    store_dir/checkpoint.json records the last fully consumed page; a page
+    cut short by target_count is fetched again on the next run. Facts are
+    deduplicated by content hash, so only hashes are kept in memory.
+    Rerunning resumes after the checkpoint and only fetches what is missing.
+    Returns the number of facts in the store.
+    """
+    store = Path(store_dir)
+    store.mkdir(parents=True, exist_ok=True)
+    facts_path = store / "facts.jsonl"
+    checkpoint_path = store / "checkpoint.json"
+
+    digests = _load_fact_store(facts_path)
+    first_page = 1
+    if checkpoint_path.exists():
+        checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        # Pages of a different size overlap; dedup absorbs the overlap
+        done = checkpoint["last_page"] * checkpoint["page_size"]
+        first_page = done // page_size + 1
+
+    if len(digests) >= target_count:
+        return len(digests)
+
+    with facts_path.open("a", encoding="utf-8") as out:
+        pages = _iter_cat_fact_pages(
+            first_page,
+            page_size,
+            max_in_flight,
+            requests_per_second,
+            lambda: target_count - len(digests),
+        )
+        for page, facts in pages:
+            complete = True
+            for fact in facts:
+                if len(digests) >= target_count:
+                    complete = False
+                    break
+                digest = _fact_digest(fact)
+                if digest not in digests:
+                    digests.add(digest)
+                    record = {"hash": digest.hex(), "fact": fact}
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            if not complete:
+                # Leave the page unchecked so a larger target resumes inside it
+                break
+
+            tmp_path = checkpoint_path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"last_page": page, "page_size": page_size}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, checkpoint_path)
+            logger.info("Page %d: %d facts stored.", page, len(digests))
+
+    return len(digests)
+
+
+def _price_record(coins: List[str], data: Dict) -> Dict:
+    """Flatten a CoinGecko price payload into one timestamped record"""
+    record = {"timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+    for coin in coins:
+        coin_key = f"{coin}_usd"
+        if coin in data and "usd" in data[coin]:
+            record[coin_key] = data[coin]["usd"]
         else:
-            logger.error("Error on page %d", page)
+            record[coin_key] = None
+
+    return record
+
+
+def _log_price_record(coins: List[str], record: Dict) -> None:
+    """Log a record as a one-line price summary"""
+    # Format the price string safely
+    price_strings = []
+    for coin in coins:
+        price = record.get(f"{coin}_usd")
+        price_str = f"{price:.2f}" if price is not None else "N/A"
+        price_strings.append(f"{coin.upper()}: ${price_str}")
+
+    logger.info("%s | %s", record["timestamp"], ", ".join(price_strings))
+
+
+def _next_tick(start: float, interval: float, tick: int, now: float) -> Tuple[int, int]:
+    """Next tick index that is still in the future, and how many were missed
+
+    Tick n is due at start + n * interval on the monotonic clock, so request
+    latency never shifts the schedule; ticks whose slot has already passed
+    are skipped rather than fired late. An interval of zero or less fires
+    ticks back to back.
+    """
+    next_tick = tick + 1
+    if interval <= 0 or now <= start + next_tick * interval:
+        return next_tick, 0
+    on_time = int((now - start) // interval) + 1
+    return on_time, on_time - next_tick
+
+
+def stream_crypto_prices(
+    coins: List[str] = None, interval: float = 5, iterations: Optional[int] = None
+) -> Iterator[Dict]:
+    """Yield price records as they arrive, on a drift-free monotonic schedule
+
+    Runs forever when iterations is None; nothing is buffered, so memory
+    stays constant. Each record carries its `tick` index and `missed_ticks`,
+    the number of ticks skipped since the previous record because a fetch
+    overran its slot.
+    """
+    if coins is None:
+        coins = ["bitcoin", "ethereum"]
+
+    start = time.monotonic()
+    tick = 0
+    missed = 0
+
+    while iterations is None or tick < iterations:
+        data = get_crypto_prices(coins)
+        if data:
+            record = _price_record(coins, data)
+            record["tick"] = tick
+            record["missed_ticks"] = missed
+            missed = 0
+            yield record
+
+        tick, skipped = _next_tick(start, interval, tick, time.monotonic())
+        missed += skipped
+        if skipped:
+            logger.warning("Skipped %d missed tick(s)", skipped)
+        if iterations is not None and tick >= iterations:
             break
 
-    return facts_list[:target_count]  # Ensure we don't exceed target
+        delay = start + tick * interval - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
 
 
 def track_crypto_prices(
@@ -149,47 +1768,123 @@ def track_crypto_prices(
     records = []
 
     try:
-        for i in range(iterations):
-            data = get_crypto_prices(coins)
-            if data:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                record = {"timestamp": timestamp}
+        for record in stream_crypto_prices(coins, interval, iterations):
+            del record["tick"], record["missed_ticks"]
+            records.append(record)
+            _log_price_record(coins, record)
 
-                for coin in coins:
-                    coin_key = f"{coin}_usd"
-                    if coin in data and "usd" in data[coin]:
-                        record[coin_key] = data[coin]["usd"]
-                    else:
-                        record[coin_key] = None
+    except KeyboardInterrupt:
+        logger.info("Stopped by user")
 
-                records.append(record)
+    return records
 
-                # Format the price string safely
-                price_strings = []
-                for coin in coins:
-                    price = record.get(f"{coin}_usd")
-                    price_str = f"{price:.2f}" if price is not None else "N/A"
-                    price_strings.append(f"{coin.upper()}: ${price_str}")
 
-                logger.info("%s | %s", timestamp, ", ".join(price_strings))
+class _MetaDescriptionParser(HTMLParser):
+    """Incremental parser that only looks for <meta name="description">
 
-            if i < iterations - 1:
-                time.sleep(interval)
+    `done` flips as soon as the tag is seen or the document head ends, so
+    the caller can stop reading the page.
+    """
 
-    except KeyboardInterrupt:
-        logger.info("Stopped by user")
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.description: Optional[str] = None
+        self.done = False
 
-    return records
+    def handle_starttag(self, tag, attrs):
+        if tag == "meta":
+            attributes = dict(attrs)
+            if (attributes.get("name") or "").lower() == "description":
+                content = attributes.get("content")
+                self.description = content if content is not None else ""
+                self.done = True
+        elif tag == "body":
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
+
+
+def _fetch_meta_description(
+    url: str, timeout: int = 5, max_bytes: int = 256 * 1024, chunk_size: int = 8192
+) -> Optional[str]:
+    """Stream a page until its meta description (or </head>) has been seen
+
+    Error pages are parsed like any other, as the original BeautifulSoup
+    scraper did; the status only feeds the circuit breaker and metrics.
+    """
+    metrics = _metrics
+    _connect_timing.seconds = 0.0
+    start = time.perf_counter()
+    received = 0
+    error = None
+
+    breaker = _breaker_for(url)
+    breaker.before_request()
+    try:
+        try:
+            response = _stream_get(url, timeout)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            breaker.record_failure()
+            raise
+        except Exception:
+            breaker.release()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        if response.status_code >= 400:
+            error = f"HTTP {response.status_code}"
+
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+                errors="replace"
+            )
+            parser = _MetaDescriptionParser()
+
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                received += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.done or received >= max_bytes:
+                    break
+
+            return parser.description
+        finally:
+            response.close()
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        if metrics is not None:
+            metrics.record(
+                f"scrape:{urlsplit(url).netloc}",
+                time.perf_counter() - start,
+                _connect_timing.seconds,
+                received,
+                error,
+            )
 
 
 def nasa_image_search(
-    query: str = "moon", media_type: str = "image", limit: int = 3
+    query: str = "moon",
+    media_type: str = "image",
+    limit: int = 3,
+    max_workers: int = 8,
+    per_host_limit: int = 2,
+    per_host_rate: float = 2.0,
 ) -> List[Dict]:
-    """Search NASA images and scrape additional details"""
-    api_url = "https://images-api.nasa.gov/search"
+    """Search NASA images and scrape additional details
+
+    Result pages are scraped concurrently by up to max_workers threads. To
+    stay polite, each host sees at most per_host_limit simultaneous requests
+    and per_host_rate requests per second. Only the page head is read.
+    """
     params = {"q": query, "media_type": media_type}
 
-    response = make_api_request(api_url, params=params)
+    response = make_api_request(NASA_API_URL, params=params)
     if not response or response.status_code != 200:
         return []
 
@@ -200,49 +1895,325 @@ def nasa_image_search(
         logger.error("Failed to parse NASA API response: %s", e)
         return []
 
-    records = []
-
+    targets = []
     for item in items[:limit]:
         try:
             title = item["data"][0].get("title", "Untitled")
             links = item.get("links", [])
             nasa_url = links[0].get("href") if links else None
 
-            if not nasa_url:
-                continue
+            if nasa_url:
+                targets.append((title, nasa_url))
 
-            # Scrape the NASA image page for more details
-            try:
-                page_response = requests.get(nasa_url, timeout=5)
-                soup = BeautifulSoup(page_response.text, "html.parser")
-
-                # Try to extract description
-                description = "No description found"
-                meta_desc = soup.find("meta", attrs={"name": "description"})
-                if meta_desc:
-                    description = meta_desc.get("content", "No description found")
-
-                # Truncate description if too long
-                if len(description) > 200:
-                    description = description[:197] + "..."
-
-                records.append(
-                    {
-                        "title": title,
-                        "url": nasa_url,
-                        "description": description,
-                    }
-                )
+        except (KeyError, IndexError) as e:
+            logger.error("Failed to process NASA item: %s", e)
+            continue
 
-                logger.info("Collected: %s", title)
+    # One concurrency slot pool and one rate limiter per host
+    hosts = {urlsplit(url).netloc for _, url in targets}
+    host_slots = {host: threading.BoundedSemaphore(per_host_limit) for host in hosts}
+    host_buckets = {host: TokenBucket(per_host_rate) for host in hosts}
 
-            except Exception as e:
-                logger.error("Failed to scrape %s: %s", nasa_url, e)
+    def scrape(title: str, nasa_url: str) -> Optional[Dict]:
+        host = urlsplit(nasa_url).netloc
+        try:
+            with host_slots[host]:
+                host_buckets[host].acquire()
+                description = _fetch_meta_description(nasa_url)
+        except Exception as e:
+            logger.error("Failed to scrape %s: %s", nasa_url, e)
+            return None
 
-            time.sleep(1)  # Be polite to the server
+        if description is None:
+            description = "No description found"
 
-        except (KeyError, IndexError) as e:
-            logger.error("Failed to process NASA item: %s", e)
-            continue
+        # Truncate description if too long
+        if len(description) > 200:
+            description = description[:197] + "..."
 
-    return records
+        logger.info("Collected: %s", title)
+        return {"title": title, "url": nasa_url, "description": description}
+
+    if not targets:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda target: scrape(*target), targets))
+
+    return [record for record in results if record is not None]
+
+
+# ---------------------------------------------------------------------------
+# Asyncio variants: plain asyncio streams, no thread per request
+# ---------------------------------------------------------------------------
+
+_async_limit = 20
+_async_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+
+
+class AsyncResponse:
+    """Minimal response object exposing the parts of requests.Response we use"""
+
+    def __init__(
+        self, url: str, status_code: int, reason: str, headers: Dict, content: bytes
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the charset from Content-Type (UTF-8 by default)"""
+        encoding = "utf-8"
+        for part in self.headers.get("content-type", "").split(";"):
+            key, _, value = part.strip().partition("=")
+            if key.lower() == "charset" and value:
+                encoding = value.strip('"')
+        try:
+            return self.content.decode(encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Parse the body as JSON"""
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        """Raise requests' HTTPError for 4xx/5xx responses"""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {self.reason} for url: {self.url}", response=self
+            )
+
+
+def set_async_concurrency(limit: int) -> None:
+    """Set the maximum number of in-flight async requests per event loop"""
+    global _async_limit
+    if limit < 1:
+        raise ValueError("Concurrency limit must be at least 1")
+    _async_limit = limit
+    _async_semaphores.clear()
+
+
+def _get_async_semaphore() -> asyncio.Semaphore:
+    """Return the concurrency semaphore belonging to the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_async_limit)
+        _async_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _build_url(url: str, params: Optional[Dict] = None) -> str:
+    """Append URL-encoded params to url the way requests does"""
+    if not params:
+        return url
+    separator = "&" if urlsplit(url).query else "?"
+    return f"{url}{separator}{urlencode(params, doseq=True)}"
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict) -> bytes:
+    """Read a response body framed by chunked encoding, Content-Length or EOF"""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                # Skip optional trailers up to the terminating blank line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    if "content-length" in headers:
+        return await reader.readexactly(int(headers["content-length"]))
+
+    return await reader.read()
+
+
+async def _async_http_get_once(url: str) -> AsyncResponse:
+    """Perform a single HTTP/1.1 GET over an asyncio stream connection"""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise requests.exceptions.InvalidURL(f"Unsupported URL: {url}")
+
+    is_https = parts.scheme == "https"
+    port = parts.port or (443 if is_https else 80)
+    ssl_context = ssl.create_default_context() if is_https else None
+    reader, writer = await asyncio.open_connection(
+        parts.hostname, port, ssl=ssl_context
+    )
+
+    try:
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        request = (
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {parts.netloc.rsplit('@', 1)[-1]}\r\n"
+            "User-Agent: python-learning-repo-async\r\n"
+            "Accept: */*\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(request.encode("latin-1"))
+        await writer.drain()
+
+        status_line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+        version, _, rest = status_line.partition(" ")
+        if not version.startswith("HTTP/"):
+            raise ValueError(f"Malformed status line: {status_line!r}")
+        code, _, reason = rest.partition(" ")
+        status_code = int(code)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if status_code in (204, 304) or 100 <= status_code < 200:
+            content = b""
+        else:
+            content = await _read_body(reader, headers)
+
+        return AsyncResponse(url, status_code, reason, headers, content)
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (OSError, AttributeError):
+            pass
+
+
+async def _async_http_get(url: str) -> AsyncResponse:
+    """GET url, following a bounded number of redirects"""
+    for _ in range(_MAX_REDIRECTS + 1):
+        response = await _async_http_get_once(url)
+        location = response.headers.get("location")
+        if response.status_code not in _REDIRECT_CODES or not location:
+            return response
+        url = urljoin(url, location)
+    raise requests.exceptions.TooManyRedirects(f"Exceeded {_MAX_REDIRECTS} redirects")
+
+
+async def async_make_api_request(
+    url: str, params: Optional[Dict] = None, timeout: int = 5
+) -> Optional[AsyncResponse]:
+    """Async counterpart of make_api_request, bounded by set_async_concurrency"""
+    full_url = _build_url(url, params)
+    try:
+        async with _get_async_semaphore():
+            response = await asyncio.wait_for(_async_http_get(full_url), timeout)
+        response.raise_for_status()
+        return response
+    except asyncio.TimeoutError:
+        logger.warning("Request timed out for URL: %s", url)
+        return None
+    except requests.exceptions.HTTPError as e:
+        logger.error("HTTP Error for URL %s: %s", url, e)
+        return None
+    except (
+        requests.exceptions.RequestException,
+        OSError,
+        ValueError,
+        asyncio.IncompleteReadError,
+    ) as e:
+        logger.error("Request failed for URL %s: %s", url, e)
+        return None
+
+
+def _parse_json_response(response: Optional[Any], label: str) -> Optional[Any]:
+    """Decode a successful response body as JSON, logging parse failures"""
+    if response and response.status_code == 200:
+        try:
+            return response.json()
+        except ValueError as e:
+            logger.error("Failed to parse %s response: %s", label, e)
+    return None
+
+
+async def async_get_joke() -> Tuple[Optional[str], Optional[str]]:
+    """Async variant of get_joke"""
+    data = _parse_json_response(await async_make_api_request(JOKE_API_URL), "joke")
+    if isinstance(data, dict):
+        return data.get("setup"), data.get("punchline")
+    return None, None
+
+
+async def async_get_dog_images(count: int = 1) -> List[str]:
+    """Async variant of get_dog_images"""
+    if count < 1:
+        return []
+
+    response = await async_make_api_request(f"{DOG_API_URL}/{count}")
+    data = _parse_json_response(response, "dog images")
+    if isinstance(data, dict):
+        return data.get("message", [])
+    return []
+
+
+async def async_get_weather(city: str, api_key: str) -> Optional[Dict]:
+    """Async variant of get_weather"""
+    params = {"q": city, "appid": api_key, "units": "metric"}
+    response = await async_make_api_request(WEATHER_API_URL, params=params)
+    return _parse_json_response(response, "weather")
+
+
+async def async_get_cat_facts(limit: int = 10, page: int = 1) -> Optional[Dict]:
+    """Async variant of get_cat_facts"""
+    params = {"limit": limit, "page": page}
+    response = await async_make_api_request(CAT_FACTS_API_URL, params=params)
+    return _parse_json_response(response, "cat facts")
+
+
+async def async_get_crypto_prices(
+    coins: List[str] = None, currency: str = "usd"
+) -> Optional[Dict]:
+    """Async variant of get_crypto_prices"""
+    if coins is None:
+        coins = ["bitcoin", "ethereum"]
+
+    params = {"ids": ",".join(coins), "vs_currencies": currency}
+    response = await async_make_api_request(CRYPTO_API_URL, params=params)
+    return _parse_json_response(response, "crypto prices")
+
+
+async def async_stream_crypto_prices(
+    coins: List[str] = None, interval: float = 5, iterations: Optional[int] = None
+) -> AsyncIterator[Dict]:
+    """Async-iterator variant of stream_crypto_prices"""
+    if coins is None:
+        coins = ["bitcoin", "ethereum"]
+
+    start = time.monotonic()
+    tick = 0
+    missed = 0
+
+    while iterations is None or tick < iterations:
+        data = await async_get_crypto_prices(coins)
+        if data:
+            record = _price_record(coins, data)
+            record["tick"] = tick
+            record["missed_ticks"] = missed
+            missed = 0
+            yield record
+
+        tick, skipped = _next_tick(start, interval, tick, time.monotonic())
+        missed += skipped
+        if skipped:
+            logger.warning("Skipped %d missed tick(s)", skipped)
+        if iterations is not None and tick >= iterations:
+            break
+
+        delay = start + tick * interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
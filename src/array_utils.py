@@ -0,0 +1,61 @@
+"""
+Flat NumPy array helpers shared by the on-disk indexes.
+
+Strings are packed into one uint8 blob plus int64 offsets, and a set of
+named arrays is saved as .npy files next to a meta.json, so np.load() can
+memory-map everything back without parsing.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class BlobStrings:
+    """Read-only sequence of byte strings packed in a blob plus offsets
+
+    Indexing slices the (possibly memory-mapped) blob, so bisect can search
+    a sorted list of strings without materializing it.
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._blob[self._offsets[index] : self._offsets[index + 1]].tobytes()
+
+
+def pack_strings(values: List[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate byte strings into (blob, offsets) arrays"""
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    if values:
+        offsets[1:] = np.cumsum([len(value) for value in values])
+    blob = np.frombuffer(b"".join(values), dtype=np.uint8)
+    return blob, offsets
+
+
+def save_arrays(directory: Path, arrays: Dict[str, np.ndarray], meta: dict) -> None:
+    """Write arrays and meta.json under directory, replacing each file atomically
+
+    Every file goes to a temporary name first and is os.replace()d into place,
+    so saving over the directory an object was memory-mapped from leaves its
+    open maps reading the old files instead of a truncated one.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, array in arrays.items():
+        target = directory / f"{name}.npy"
+        temporary = directory / f"{name}.npy.tmp"
+        with open(temporary, "wb") as file:
+            np.save(file, array)
+        os.replace(temporary, target)
+    temporary = directory / "meta.json.tmp"
+    temporary.write_text(json.dumps(meta), encoding="utf-8")
+    os.replace(temporary, directory / "meta.json")
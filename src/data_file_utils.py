@@ -1,6 +1,19 @@
 from pathlib import Path
+import bz2
 import csv
-from collections import defaultdict
+import gzip
+import hashlib
+import io
+import json
+import lzma
+import os
+import shutil
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Read size for input streams; large reads keep decompressors busy
+_READ_BUFFER_BYTES = 1024 * 1024
 
 
 def create_sample_directory_structure():
@@ -40,23 +53,893 @@ def move_files_by_extension(source_dir, target_dir, extensions):
     return moved_count
 
 
-def calculate_high_scores(input_path, output_path):
-    """Calculate high scores from CSV data"""
+class MoveProgress:
+    """Thread-safe counters for move_files_bulk, readable while it runs
+
+    scanned counts directory entries looked at, matched those selected,
+    moved those renamed or copied, bytes_copied the data copied across
+    devices and failed those that raised (listed in errors). In dedupe
+    mode hashed counts partial and full hashes computed and duplicates the
+    matches whose content was already in the target. plan holds (source, destination,
+    method) for each match in a dry run.
+    """
+
+    def __init__(self):
+        self.scanned = 0
+        self.matched = 0
+        self.moved = 0
+        self.bytes_copied = 0
+        self.hashed = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.errors = []
+        self.plan = []
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """Current counters as a dict"""
+        with self._lock:
+            return {
+                "scanned": self.scanned,
+                "matched": self.matched,
+                "moved": self.moved,
+                "bytes_copied": self.bytes_copied,
+                "hashed": self.hashed,
+                "duplicates": self.duplicates,
+                "failed": self.failed,
+            }
+
+    def _add(self, **counts):
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+
+# Files handed to a worker at a time by move_files_bulk
+_MOVE_BATCH_SIZE = 256
+
+
+def move_files_bulk(
+    source_dir,
+    target_dir,
+    extensions,
+    max_workers=8,
+    dry_run=False,
+    progress=None,
+    dedupe=None,
+    index_path=None,
+):
+    """Move files with specific extensions, for directories of millions
+
+    Entries come from os.scandir and are matched against a precomputed
+    lowercase extension set (same suffix rules as move_files_by_extension;
+    directories are skipped). Batches of files are renamed concurrently
+    when source and target share a device, or copied and unlinked in
+    parallel when they don't. Per-file errors are recorded rather than
+    raised. With dry_run=True nothing is touched and progress.plan lists
+    the moves. Pass a MoveProgress to watch the counters from another
+    thread; the one used is returned.
+
+    dedupe="skip" or "hardlink" compares contents with the target first
+    (size, then a partial hash, then a full hash, hashed on the thread
+    pool). A duplicate is left in the source ("skip") or becomes a hard
+    link to the identical target file ("hardlink"), and a different file
+    with a taken name is stored as name_1.ext instead of overwriting.
+    Hashes of target files and of source files left behind are kept in
+    index_path (default: .dedupe-index.json in the target) so later runs
+    only hash new or changed files.
+    """
+    if dedupe not in (None, "skip", "hardlink"):
+        raise ValueError(f"Unknown dedupe mode {dedupe!r}")
+    source_dir = os.fspath(source_dir)
+    target_dir = os.fspath(target_dir)
+    extensions = {ext.lower() for ext in extensions}
+    progress = progress if progress is not None else MoveProgress()
+    same_device = os.stat(source_dir).st_dev == os.stat(target_dir).st_dev
+    method = "rename" if same_device else "copy"
+    workers = {"rename": _rename_batch, "copy": _copy_batch, "hardlink": _link_batch}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if dedupe is None:
+            batches = (
+                (
+                    method,
+                    [(path, os.path.join(target_dir, name)) for path, name in batch],
+                )
+                for batch in _matching_batches(source_dir, extensions, progress)
+            )
+        else:
+            index_path = os.fspath(
+                index_path or os.path.join(target_dir, _DEDUPE_INDEX_NAME)
+            )
+            batches, index, sources = _plan_deduplicated(
+                source_dir,
+                target_dir,
+                extensions,
+                method,
+                dedupe,
+                index_path,
+                executor,
+                progress,
+            )
+
+        pending = deque()
+        linking = False
+        for batch_method, moves in batches:
+            if dry_run:
+                progress.plan.extend((move[0], move[1], batch_method) for move in moves)
+                continue
+            if batch_method == "skip":
+                continue
+            if batch_method == "hardlink" and not linking:
+                # Links may point at files the earlier batches are moving in
+                while pending:
+                    pending.popleft().result()
+                linking = True
+            # Bound the work queued ahead of the workers
+            if len(pending) >= max_workers * 2:
+                pending.popleft().result()
+            pending.append(executor.submit(workers[batch_method], moves, progress))
+        for future in pending:
+            future.result()
+
+    if dedupe is not None and not dry_run:
+        _save_dedupe_index(index_path, target_dir, index, sources)
+    return progress
+
+
+def _matching_batches(source_dir, extensions, progress):
+    """Yield lists of (path, name) for matching non-directory entries"""
+    batch = []
+    scanned = 0
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            scanned += 1
+            name = entry.name
+            dot = name.rfind(".")
+            # Path.suffix rules: no suffix for ".name" or "name."
+            if dot < 1 or dot == len(name) - 1:
+                continue
+            if name[dot:].lower() not in extensions:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                continue
+            batch.append((entry.path, name))
+            if len(batch) == _MOVE_BATCH_SIZE:
+                progress._add(scanned=scanned, matched=len(batch))
+                scanned = 0
+                yield batch
+                batch = []
+    progress._add(scanned=scanned, matched=len(batch))
+    if batch:
+        yield batch
+
+
+def _rename_batch(moves, progress):
+    """Rename each (source, destination) on the same device"""
+    moved = 0
+    for source, destination in moves:
+        try:
+            os.replace(source, destination)
+            moved += 1
+        except OSError as error:
+            _record_move_error(progress, source, error)
+    progress._add(moved=moved)
+
+
+def _copy_batch(moves, progress):
+    """Copy each (source, destination) across devices, then unlink the source
+
+    Data lands under a temporary name and is renamed into place, so the
+    destination never holds a partial file.
+    """
+    moved = 0
+    copied = 0
+    for source, destination in moves:
+        partial = destination + ".partial"
+        try:
+            shutil.copy2(source, partial, follow_symlinks=False)
+            size = os.lstat(partial).st_size
+            os.replace(partial, destination)
+            os.unlink(source)
+            moved += 1
+            copied += size
+        except OSError as error:
+            if os.path.lexists(partial):
+                os.unlink(partial)
+            _record_move_error(progress, source, error)
+    progress._add(moved=moved, bytes_copied=copied)
+
+
+def _link_batch(moves, progress):
+    """For each (source, destination, existing), link destination to the
+    identical target file existing and remove source"""
+    moved = 0
+    for source, destination, existing in moves:
+        try:
+            if existing != destination:
+                os.link(existing, destination)
+            os.unlink(source)
+            moved += 1
+        except OSError as error:
+            _record_move_error(progress, source, error)
+    progress._add(moved=moved)
+
+
+def _record_move_error(progress, source, error):
+    with progress._lock:
+        progress.failed += 1
+        progress.errors.append((source, error))
+
+
+# Bytes hashed from each end of a file for the partial hash
+_PARTIAL_HASH_BYTES = 64 * 1024
+_DEDUPE_INDEX_NAME = ".dedupe-index.json"
+_DEDUPE_INDEX_VERSION = 1
+
+
+def _plan_deduplicated(
+    source_dir, target_dir, extensions, method, dedupe, index_path, executor, progress
+):
+    """Batches of (method, moves) for a dedupe run, the updated target index
+    and the source file records
+
+    Moves are (source, destination) pairs, except for hard links, which
+    are (source, destination, existing), and skipped duplicates, which
+    are (source, existing).
+    """
+    index, source_index = _load_dedupe_index(index_path)
+    taken = {os.path.basename(index_path)}
+    targets = {}
+    with os.scandir(target_dir) as entries:
+        for entry in entries:
+            taken.add(entry.name)
+            if entry.path == index_path or not entry.is_file(follow_symlinks=False):
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            targets[entry.name] = _cached_record(entry.path, stat, index, entry.name)
+
+    sources = []
+    for batch in _matching_batches(source_dir, extensions, progress):
+        for path, name in batch:
+            try:
+                stat = os.lstat(path)
+            except OSError as error:
+                _record_move_error(progress, path, error)
+                continue
+            key = os.path.abspath(path)
+            sources.append((name, _cached_record(path, stat, source_index, key)))
+
+    _hash_candidates(
+        list(targets.values()) + [record for _, record in sources], executor, progress
+    )
+
+    # Content already in the target, by (size, full hash)
+    stored = {}
+    for name, record in targets.items():
+        if record["full"] is not None:
+            stored.setdefault((record["size"], record["full"]), name)
+
+    planned = {name: record for name, record in targets.items()}
+    by_method = {method: [], "hardlink": [], "skip": []}
+    duplicates = 0
+    for name, record in sources:
+        key = (record["size"], record["full"]) if record["full"] else None
+        existing = stored.get(key)
+        if existing is not None:
+            duplicates += 1
+            existing_path = os.path.join(target_dir, existing)
+            if dedupe == "skip":
+                by_method["skip"].append((record["path"], existing_path))
+                continue
+            if name == existing:
+                destination = existing
+            else:
+                destination = _free_name(name, taken)
+                planned[destination] = planned[existing]
+            by_method["hardlink"].append(
+                (record["path"], os.path.join(target_dir, destination), existing_path)
+            )
+            continue
+
+        destination = _free_name(name, taken)
+        planned[destination] = record
+        if key is not None:
+            stored[key] = destination
+        by_method[method].append(
+            (record["path"], os.path.join(target_dir, destination))
+        )
+    progress._add(duplicates=duplicates)
+
+    batches = [
+        (batch_method, moves[start : start + _MOVE_BATCH_SIZE])
+        for batch_method, moves in by_method.items()
+        for start in range(0, len(moves), _MOVE_BATCH_SIZE)
+    ]
+    return batches, planned, [record for _, record in sources]
+
+
+def _file_record(path, stat):
+    """Size, mtime and (not yet computed) hashes of a file"""
+    return {
+        "path": path,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "partial": None,
+        "full": None,
+    }
+
+
+def _cached_record(path, stat, index, key):
+    """_file_record with hashes from index[key] if size and mtime still match"""
+    record = _file_record(path, stat)
+    cached = index.get(key)
+    if cached and cached[:2] == [record["size"], record["mtime_ns"]]:
+        record["partial"], record["full"] = cached[2], cached[3]
+    return record
+
+
+def _hash_candidates(records, executor, progress):
+    """Fill in partial hashes where sizes collide, then full hashes where
+    partial hashes collide; files that can't be read stay unhashed"""
+
+    def colliding(key):
+        groups = defaultdict(list)
+        for record in records:
+            groups[key(record)].append(record)
+        return [r for group in groups.values() if len(group) > 1 for r in group]
+
+    hashed = 0
+    need = [r for r in colliding(lambda r: r["size"]) if r["partial"] is None]
+    for record, digest in zip(need, executor.map(_partial_hash, need)):
+        record["partial"] = digest
+        # Small files are hashed whole by the partial hash
+        if digest is not None and record["size"] <= 2 * _PARTIAL_HASH_BYTES:
+            record["full"] = digest
+    hashed += len(need)
+
+    candidates = colliding(lambda r: (r["size"], r["partial"]))
+    need = [r for r in candidates if r["partial"] is not None and r["full"] is None]
+    for record, digest in zip(need, executor.map(_full_hash, need)):
+        record["full"] = digest
+    hashed += len(need)
+    progress._add(hashed=hashed)
+
+
+def _partial_hash(record):
+    """blake2b of a file's first and last _PARTIAL_HASH_BYTES"""
+    try:
+        with open(record["path"], "rb") as file:
+            digest = hashlib.blake2b(file.read(_PARTIAL_HASH_BYTES), digest_size=16)
+            if record["size"] > 2 * _PARTIAL_HASH_BYTES:
+                file.seek(-_PARTIAL_HASH_BYTES, os.SEEK_END)
+            digest.update(file.read())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _full_hash(record):
+    """blake2b of a whole file"""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(record["path"], "rb") as file:
+            for block in iter(lambda: file.read(_READ_BUFFER_BYTES), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _free_name(name, taken):
+    """name, or name_1.ext, name_2.ext, ... if taken; marks the result taken"""
+    candidate = name
+    stem, ext = os.path.splitext(name)
+    number = 0
+    while candidate in taken:
+        number += 1
+        candidate = f"{stem}_{number}{ext}"
+    taken.add(candidate)
+    return candidate
+
+
+def _load_dedupe_index(index_path):
+    """Target name -> [size, mtime_ns, partial, full], and the same keyed by
+    absolute source path, from a saved index"""
+    try:
+        with open(index_path, encoding="utf-8") as file:
+            index = json.load(file)
+    except FileNotFoundError:
+        return {}, {}
+    if index.get("version") != _DEDUPE_INDEX_VERSION:
+        return {}, {}
+    return index["files"], index.get("sources", {})
+
+
+def _save_dedupe_index(index_path, target_dir, planned, sources):
+    """Write the index for the target files that exist after the run, and
+    for hashed source files still in place (skipped or failed moves)"""
+    files = {}
+    for name, record in planned.items():
+        try:
+            stat = os.lstat(os.path.join(target_dir, name))
+        except OSError:
+            continue  # the move failed
+        if stat.st_size == record["size"]:
+            files[name] = [
+                stat.st_size,
+                stat.st_mtime_ns,
+                record["partial"],
+                record["full"],
+            ]
+    left = {}
+    for record in sources:
+        if record["partial"] is None:
+            continue
+        try:
+            stat = os.lstat(record["path"])
+        except OSError:
+            continue  # moved
+        if [stat.st_size, stat.st_mtime_ns] == [record["size"], record["mtime_ns"]]:
+            left[os.path.abspath(record["path"])] = [
+                stat.st_size,
+                stat.st_mtime_ns,
+                record["partial"],
+                record["full"],
+            ]
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(
+            {"version": _DEDUPE_INDEX_VERSION, "files": files, "sources": left}, file
+        )
+    os.replace(tmp_path, index_path)
+
+
+def detect_compression(input_path):
+    """ "gzip", "bz2" or "xz" from a file's magic bytes, or None if plain"""
+    with open(input_path, "rb") as file:
+        head = file.read(6)
+    if head.startswith(b"\x1f\x8b"):
+        return "gzip"
+    if head.startswith(b"BZh") and head[3:4].isdigit():
+        return "bz2"
+    if head.startswith(b"\xfd7zXZ\x00"):
+        return "xz"
+    return None
+
+
+def open_input(input_path, mode="r"):
+    """Open a plain, gzip, bz2 or xz file for streaming reads
+
+    The format is detected from the file's contents, not its name, and
+    compressed data is decompressed on the fly with no temporary files.
+    mode="r" gives UTF-8 text with newline="" (as the csv module wants);
+    mode="rb" gives bytes. Reads are buffered in 1 MiB blocks.
+    """
+    if mode not in ("r", "rb"):
+        raise ValueError(f"Unsupported mode {mode!r}")
+    compression = detect_compression(input_path)
+    if compression is None:
+        stream = open(input_path, "rb", buffering=_READ_BUFFER_BYTES)
+    else:
+        opener = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}[compression]
+        stream = io.BufferedReader(
+            opener(input_path, "rb"), buffer_size=_READ_BUFFER_BYTES
+        )
+    if mode == "rb":
+        return stream
+    return io.TextIOWrapper(stream, encoding="utf-8", newline="")
+
+
+def calculate_high_scores(
+    input_path, output_path, engine="csv", chunksize=1_000_000, max_workers=None
+):
+    """Calculate high scores from CSV data
+
+    engine="csv" parses row by row with csv.DictReader; engine="chunked"
+    parses chunksize rows at a time with pandas and reduces each chunk
+    with a vectorized group-by, so memory stays bounded by the chunk size
+    and the number of distinct players. engine="mmap" scans the raw bytes
+    of a plain name,score file in line-aligned slices on max_workers
+    threads, falling back to the csv engine for anything else (quoting,
+    extra columns, unusual numbers). All engines write the same file.
+    Compressed input (.gz, .bz2, .xz, detected by content) is streamed.
+    """
+    high_scores = _high_scores(input_path, engine, chunksize, max_workers)
+    _write_high_scores(output_path, high_scores)
+    return high_scores
+
+
+def calculate_high_scores_multi(
+    input_paths, output_path, max_workers=None, engine="chunked", chunksize=1_000_000
+):
+    """Calculate high scores across many shard CSVs on a process pool
+
+    Each worker reduces whole shards to partial per-player maxima with the
+    given engine and chunksize; the partials are merged in shard order, so
+    the output matches calculate_high_scores on the concatenated shards.
+    Compressed shards are decompressed by the workers, in parallel.
+    max_workers defaults to the number of CPUs.
+    """
+    if engine not in _ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}")
+    input_paths = [Path(path) for path in input_paths]
+    max_workers = min(max_workers or os.cpu_count() or 1, max(1, len(input_paths)))
+    tasks = [(path, engine, chunksize) for path in input_paths]
+
     high_scores = defaultdict(int)
+    if max_workers == 1:
+        partials = map(_shard_high_scores, tasks)
+        _merge_high_scores(high_scores, partials)
+    else:
+        # Batch small shards so per-task IPC doesn't dominate
+        batch = max(1, len(tasks) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            partials = executor.map(_shard_high_scores, tasks, chunksize=batch)
+            _merge_high_scores(high_scores, partials)
 
-    with input_path.open(mode="r", encoding="utf-8", newline="") as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            player = row["name"]
-            score = int(row["score"])
+    _write_high_scores(output_path, high_scores)
+    return high_scores
+
+
+# Leading bytes of the input fingerprinted to detect a rewritten file
+_FINGERPRINT_BYTES = 4096
+_STATE_VERSION = 1
+
+
+def update_high_scores(input_path, output_path, state_path):
+    """Incrementally update high scores from an append-only score log
+
+    state_path holds the per-player maxima and the byte offset already
+    processed, so each run parses only rows appended since the last one
+    and then rewrites output_path. A trailing line without a newline is
+    left for the next run. If the input was truncated, rotated (new
+    inode) or rewritten (its first bytes changed), the state is rebuilt
+    from the whole file. Compressed logs are not supported.
+    """
+    input_path = Path(input_path)
+    state_path = Path(state_path)
+    if detect_compression(input_path):
+        raise ValueError(
+            f"{input_path} is compressed; incremental reads need a plain log"
+        )
+    state = _load_high_score_state(state_path, input_path)
+
+    with input_path.open(mode="rb") as file:
+        stat = os.fstat(file.fileno())
+        if state is not None and not _state_matches(state, file, stat):
+            state = None
+        if state is None:
+            state = {"offset": 0, "fieldnames": None, "high_scores": {}}
+
+        high_scores = defaultdict(int, state["high_scores"])
+        file.seek(state["offset"])
+        offset, fieldnames = _consume_score_lines(
+            file, state["offset"], state["fieldnames"], high_scores
+        )
+
+        file.seek(0)
+        prefix = file.read(min(offset, _FINGERPRINT_BYTES))
+
+    _write_high_scores(output_path, high_scores)
+    _save_high_score_state(
+        state_path,
+        {
+            "version": _STATE_VERSION,
+            "input": str(input_path.resolve()),
+            "device": stat.st_dev,
+            "inode": stat.st_ino,
+            "offset": offset,
+            "fingerprint": hashlib.blake2b(prefix, digest_size=16).hexdigest(),
+            "fingerprint_bytes": len(prefix),
+            "fieldnames": fieldnames,
+            "high_scores": high_scores,
+        },
+    )
+    return high_scores
+
+
+def _load_high_score_state(state_path, input_path):
+    """Saved state for input_path, or None if missing or for another file"""
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    if state.get("version") != _STATE_VERSION:
+        return None
+    if state.get("input") != str(input_path.resolve()):
+        return None
+    return state
+
+
+def _state_matches(state, file, stat):
+    """Whether file is still the file state was built from, only appended to"""
+    if (stat.st_dev, stat.st_ino) != (state["device"], state["inode"]):
+        return False  # rotated
+    if stat.st_size < state["offset"]:
+        return False  # truncated
+    file.seek(0)
+    prefix = file.read(state["fingerprint_bytes"])
+    digest = hashlib.blake2b(prefix, digest_size=16).hexdigest()
+    return digest == state["fingerprint"]
+
+
+def _consume_score_lines(file, offset, fieldnames, high_scores):
+    """Fold complete lines from file's position into high_scores
+
+    Returns the offset after the last complete line and the field names
+    (read from the header line when starting at offset 0).
+    """
+    position = [offset]
+
+    def complete_lines():
+        for line in file:
+            if not line.endswith(b"\n"):
+                break  # still being written
+            position[0] += len(line)
+            yield line.decode("utf-8")
+
+    lines = complete_lines()
+    reader = csv.DictReader(lines, fieldnames=fieldnames)
+    for row in reader:
+        player = row["name"]
+        score = int(row["score"])
+        if score > high_scores[player]:
+            high_scores[player] = score
+    return position[0], fieldnames or reader.fieldnames
+
+
+def _save_high_score_state(state_path, state):
+    """Write state atomically"""
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state), encoding="utf-8")
+    tmp_path.replace(state_path)
+
+
+def _shard_high_scores(task):
+    """Partial maxima of one shard (process pool worker)"""
+    input_path, engine, chunksize = task
+    return dict(_high_scores(input_path, engine, chunksize, max_workers=1))
+
+
+def _merge_high_scores(high_scores, partials):
+    """Fold partial per-player maxima into high_scores"""
+    for partial in partials:
+        for player, score in partial.items():
             if score > high_scores[player]:
                 high_scores[player] = score
 
-    # Write high scores
+
+def _write_high_scores(output_path, high_scores):
+    """Write a name,high_score CSV"""
     with output_path.open(mode="w", encoding="utf-8", newline="") as file:
         writer = csv.writer(file)
         writer.writerow(["name", "high_score"])
         for player, score in high_scores.items():
             writer.writerow([player, score])
 
+
+_ENGINES = ("csv", "chunked", "mmap")
+
+
+def _high_scores(input_path, engine, chunksize, max_workers):
+    """Per-player maxima of one file computed with the given engine"""
+    if engine == "csv":
+        return _high_scores_csv(input_path)
+    if engine == "chunked":
+        return _high_scores_chunked(input_path, chunksize)
+    if engine == "mmap":
+        return _high_scores_mmap(input_path, max_workers)
+    raise ValueError(f"Unknown engine {engine!r}")
+
+
+def _high_scores_csv(input_path):
+    """Highest score per player (floored at 0), in order of first appearance"""
+    high_scores = defaultdict(int)
+
+    with open_input(input_path) as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            player = row["name"]
+            score = int(row["score"])
+            if score > high_scores[player]:
+                high_scores[player] = score
+
+    return high_scores
+
+
+def _high_scores_chunked(input_path, chunksize):
+    """_high_scores_csv computed over pandas chunks of chunksize rows"""
+    import pandas as pd
+
+    high_scores = defaultdict(int)
+    with open_input(input_path, "rb") as stream:
+        try:
+            chunks = pd.read_csv(
+                stream,
+                usecols=["name", "score"],
+                dtype={"name": str, "score": "int64"},
+                na_filter=False,
+                encoding="utf-8",
+                chunksize=chunksize,
+            )
+        except pd.errors.EmptyDataError:  # no header either, as csv.DictReader
+            return high_scores
+        with chunks:
+            for chunk in chunks:
+                # One (player, max) pair per distinct player, in first-seen order
+                chunk_max = chunk.groupby("name", sort=False)["score"].max()
+                for player, score in zip(chunk_max.index, chunk_max.tolist()):
+                    if score > high_scores[player]:
+                        high_scores[player] = score
+
     return high_scores
+
+
+# Target size of the line-aligned slices scanned by the mmap engine
+_MMAP_SLICE_BYTES = 64 * 1024 * 1024
+# Longer names take the csv path rather than a wide fixed-width name array
+_MMAP_MAX_NAME_BYTES = 128
+
+
+def _high_scores_mmap(input_path, max_workers=None, slice_bytes=_MMAP_SLICE_BYTES):
+    """_high_scores_csv computed by scanning raw bytes in line-aligned slices
+
+    Plain files are memory-mapped; compressed ones are decompressed into
+    blocks of about slice_bytes that are scanned while the next one is
+    being decompressed.
+    """
+    import numpy as np
+
+    input_path = Path(input_path)
+    max_workers = max_workers or os.cpu_count() or 1
+    if detect_compression(input_path):
+        with open_input(input_path, "rb") as stream:
+            if stream.readline().rstrip(b"\r\n") != b"name,score":
+                return _high_scores_csv(input_path)
+            partials = _scan_slices(_stream_slices(stream, slice_bytes), max_workers)
+    else:
+        with input_path.open(mode="rb") as file:
+            header = file.readline()
+            if header.rstrip(b"\r\n") != b"name,score":
+                return _high_scores_csv(input_path)
+            # Line-aligned slice bounds, found by reading to the next newline
+            size = os.fstat(file.fileno()).st_size
+            bounds = [file.tell()]
+            while bounds[-1] < size:
+                file.seek(max(bounds[-1] + slice_bytes, bounds[-1] + 1) - 1)
+                file.readline()
+                bounds.append(min(file.tell(), size))
+
+        if len(bounds) == 1:
+            return defaultdict(int)
+        # A plain ndarray view of the map skips np.memmap's per-slice overhead
+        buffer = np.memmap(input_path, dtype=np.uint8, mode="r").view(np.ndarray)
+        slices = [buffer[start:end] for start, end in zip(bounds, bounds[1:])]
+        partials = _scan_slices(slices, min(max_workers, len(slices)))
+        del slices, buffer
+
+    if any(partial is None for partial in partials):
+        return _high_scores_csv(input_path)
+    high_scores = defaultdict(int)
+    for names, maxima in partials:
+        for name, score in zip(names, maxima.tolist()):
+            player = name.decode("utf-8")
+            if score > high_scores[player]:
+                high_scores[player] = score
+    return high_scores
+
+
+def _stream_slices(stream, slice_bytes):
+    """Line-aligned uint8 arrays of about slice_bytes read from a byte stream"""
+    import numpy as np
+
+    rest = b""
+    while True:
+        block = stream.read(slice_bytes)
+        if not block:
+            break
+        block = rest + block
+        cut = block.rfind(b"\n") + 1
+        rest = block[cut:]
+        if cut:
+            yield np.frombuffer(block, dtype=np.uint8)[:cut]
+    if rest:
+        yield np.frombuffer(rest, dtype=np.uint8)
+
+
+def _scan_slices(slices, max_workers):
+    """_scan_score_slice over slices in order, at most max_workers at a time"""
+    if max_workers == 1:
+        return [_scan_score_slice(data) for data in slices]
+
+    # The scan is NumPy work that mostly releases the GIL, so threads scale;
+    # bounding the window bounds memory when slices come from a stream
+    partials = []
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for data in slices:
+            if len(pending) == max_workers:
+                partials.append(pending.popleft().result())
+            pending.append(executor.submit(_scan_score_slice, data))
+        partials.extend(future.result() for future in pending)
+    return partials
+
+
+def _scan_score_slice(data):
+    """(names, maxima) in first-seen order for name,score lines, or None
+
+    data holds whole lines as raw bytes. None means the slice has something
+    the scanner does not handle and the csv engine must be used instead.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if (data == ord('"')).any() or (data == 0).any():
+        return None
+
+    # Line bounds; a final line may lack its newline
+    newlines = np.flatnonzero(data == ord("\n"))
+    ends = newlines
+    if len(data) and data[-1] != ord("\n"):
+        ends = np.append(newlines, len(data))
+    starts = np.concatenate(([0], newlines + 1))[: len(ends)]
+
+    # A carriage return is only allowed as part of a line's \r\n ending
+    returns = np.flatnonzero(data == ord("\r"))
+    if len(returns):
+        if returns[-1] + 1 >= len(data) or (data[returns + 1] != ord("\n")).any():
+            return None
+        ends = ends - np.isin(ends - 1, returns)
+
+    # Blank lines are skipped, every other line needs exactly one comma
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    commas = np.flatnonzero(data == ord(","))
+    if len(commas) != len(starts):
+        return None
+    if len(starts) == 0:
+        return [], np.zeros(0, dtype=np.int64)
+    if ((commas < starts) | (commas >= ends)).any():
+        return None
+
+    # Scores: optional sign then 1..18 digits, parsed in place
+    signs = data[np.minimum(commas + 1, len(data) - 1)]
+    signed = (signs == ord("-")) | (signs == ord("+"))
+    digit_starts = commas + 1 + signed
+    digit_counts = ends - digit_starts
+    if ((digit_counts < 1) | (digit_counts > 18)).any():
+        return None
+    scores = np.zeros(len(ends), dtype=np.int64)
+    for place in range(int(digit_counts.max())):
+        present = digit_counts > place
+        digits = np.where(present, data[ends - 1 - place * present], ord("0"))
+        if ((digits < ord("0")) | (digits > ord("9"))).any():
+            return None
+        scores += (digits - ord("0")).astype(np.int64) * 10**place
+    scores[signs == ord("-")] *= -1
+
+    # Group lines by a 64-bit FNV-1a hash of the name bytes
+    name_lengths = commas - starts
+    width = int(name_lengths.max())
+    if width > _MMAP_MAX_NAME_BYTES:
+        return None
+    name_columns = []
+    keys = np.full(len(starts), 0xCBF29CE484222325, dtype=np.uint64)
+    for column in range(width):
+        present = name_lengths > column
+        name_columns.append(np.where(present, data[starts + column * present], 0))
+        keys ^= name_columns[-1]
+        keys *= np.uint64(0x100000001B3)
+
+    # Codes number the players in order of first appearance
+    codes, _ = pd.factorize(keys)
+    running = np.maximum.accumulate(codes)
+    first_seen = np.flatnonzero(np.concatenate(([True], running[1:] > running[:-1])))
+    for name_column in name_columns:
+        if (name_column != name_column[first_seen[codes]]).any():
+            return None  # hash collision
+    maxima = np.full(len(first_seen), np.iinfo(np.int64).min)
+    np.maximum.at(maxima, codes, scores)
+    names = [data[starts[i] : commas[i]].tobytes() for i in first_seen.tolist()]
+    return names, maxima
@@ -0,0 +1,245 @@
+"""
+Inverted index with BM25 ranking over collected cat facts.
+
+Build it from collect_cat_facts_dataset() or iter_stored_cat_facts(),
+query it with search(), and save() it as flat NumPy arrays that load()
+memory-maps back without parsing.
+"""
+
+import json
+import math
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .array_utils import BlobStrings, pack_strings, save_arrays
+except ImportError:  # imported with src/ on sys.path, as in the notebooks
+    from array_utils import BlobStrings, pack_strings, save_arrays
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_FORMAT_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens of text"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class FactIndex:
+    """BM25-ranked inverted index that supports incremental adds
+
+    An index is a read-only base segment (flat arrays, memory-mapped after
+    load()) plus an in-memory delta holding facts added since. Queries score
+    both segments with shared corpus statistics; save() merges them.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # Base segment (empty until load())
+        self._base_docs = 0
+        self._base_length = 0
+        self._terms: Optional[BlobStrings] = None
+        self._posting_offsets = np.zeros(1, dtype=np.int64)
+        self._doc_ids = np.zeros(0, dtype=np.int32)
+        self._tfs = np.zeros(0, dtype=np.int32)
+        self._doc_lengths = np.zeros(0, dtype=np.int32)
+        self._facts: Optional[BlobStrings] = None
+        self._clear_delta()
+
+    @classmethod
+    def from_facts(cls, facts: Iterable[str], **kwargs) -> "FactIndex":
+        """Build an index holding every fact in facts"""
+        index = cls(**kwargs)
+        index.add_many(facts)
+        return index
+
+    def __len__(self) -> int:
+        return self._base_docs + len(self._delta_facts)
+
+    def add(self, fact: str) -> int:
+        """Index one fact and return its document id"""
+        doc_id = len(self)
+        counts: Dict[str, int] = {}
+        tokens = tokenize(fact)
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, tf in counts.items():
+            self._delta_postings.setdefault(token, []).append((doc_id, tf))
+        self._delta_lengths.append(len(tokens))
+        self._delta_length += len(tokens)
+        self._delta_facts.append(fact)
+        return doc_id
+
+    def add_many(self, facts: Iterable[str]) -> None:
+        """Index every fact in facts"""
+        for fact in facts:
+            self.add(fact)
+
+    def fact(self, doc_id: int) -> str:
+        """Text of a document"""
+        if doc_id < self._base_docs:
+            return self._facts[doc_id].decode("utf-8")
+        return self._delta_facts[doc_id - self._base_docs]
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """Top-k (fact, score) pairs for query, best first"""
+        ids, scores = self._score(query)
+        if not len(ids) or k < 1:
+            return []
+        if len(ids) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[top], scores[top]
+        order = np.lexsort((ids, -scores))
+        return [(self.fact(int(ids[i])), float(scores[i])) for i in order]
+
+    def _score(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Summed BM25 scores of every document matching a query term"""
+        total_docs = len(self)
+        if not total_docs:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        avg_length = (self._base_length + self._delta_length) / total_docs or 1.0
+
+        id_parts = []
+        score_parts = []
+        for term in set(tokenize(query)):
+            base_ids, base_tfs = self._base_postings(term)
+            delta = self._delta_postings.get(term, ())
+            df = len(base_ids) + len(delta)
+            if not df:
+                continue
+
+            ids = np.concatenate(
+                [base_ids.astype(np.int64), np.array([d for d, _ in delta], np.int64)]
+            )
+            tfs = np.concatenate(
+                [base_tfs.astype(np.float64), np.array([t for _, t in delta], float)]
+            )
+            lengths = np.concatenate(
+                [
+                    self._doc_lengths[base_ids].astype(np.float64),
+                    np.array(
+                        [self._delta_lengths[d - self._base_docs] for d, _ in delta],
+                        float,
+                    ),
+                ]
+            )
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+            id_parts.append(ids)
+            score_parts.append(idf * tfs * (self.k1 + 1) / (tfs + norm))
+
+        if not id_parts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        if len(id_parts) == 1:
+            return id_parts[0], score_parts[0]
+        ids, inverse = np.unique(np.concatenate(id_parts), return_inverse=True)
+        return ids, np.bincount(inverse, weights=np.concatenate(score_parts))
+
+    def _base_postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(doc_ids, tfs) of term in the base segment"""
+        if self._terms is None:
+            return self._doc_ids[:0], self._tfs[:0]
+        key = term.encode("utf-8")
+        position = bisect_left(self._terms, key)
+        if position == len(self._terms) or self._terms[position] != key:
+            return self._doc_ids[:0], self._tfs[:0]
+        start = self._posting_offsets[position]
+        end = self._posting_offsets[position + 1]
+        return self._doc_ids[start:end], self._tfs[start:end]
+
+    def save(self, path: str) -> None:
+        """Write base + delta as one segment of flat arrays under path
+
+        The index then continues from the saved segment with an empty delta,
+        so a load(), add(), save() loop on one path keeps working.
+        """
+        directory = Path(path)
+
+        base_terms = (
+            [self._terms[i].decode("utf-8") for i in range(len(self._terms))]
+            if self._terms is not None
+            else []
+        )
+        vocabulary = sorted(set(base_terms) | set(self._delta_postings))
+        posting_offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        id_chunks = []
+        tf_chunks = []
+        for position, term in enumerate(vocabulary):
+            base_ids, base_tfs = self._base_postings(term)
+            delta = self._delta_postings.get(term, ())
+            id_chunks.append(np.asarray(base_ids, dtype=np.int32))
+            id_chunks.append(np.array([d for d, _ in delta], dtype=np.int32))
+            tf_chunks.append(np.asarray(base_tfs, dtype=np.int32))
+            tf_chunks.append(np.array([t for _, t in delta], dtype=np.int32))
+            posting_offsets[position + 1] = (
+                posting_offsets[position] + len(base_ids) + len(delta)
+            )
+
+        term_blob, term_offsets = pack_strings([t.encode("utf-8") for t in vocabulary])
+        facts = [self.fact(i).encode("utf-8") for i in range(len(self))]
+        fact_blob, fact_offsets = pack_strings(facts)
+        doc_lengths = np.concatenate(
+            [
+                np.asarray(self._doc_lengths, dtype=np.int32),
+                np.array(self._delta_lengths, dtype=np.int32),
+            ]
+        )
+
+        arrays = {
+            "terms": term_blob,
+            "term_offsets": term_offsets,
+            "posting_offsets": posting_offsets,
+            "doc_ids": np.concatenate(id_chunks or [np.zeros(0, np.int32)]),
+            "tfs": np.concatenate(tf_chunks or [np.zeros(0, np.int32)]),
+            "doc_lengths": doc_lengths,
+            "facts": fact_blob,
+            "fact_offsets": fact_offsets,
+        }
+        meta = {
+            "version": _FORMAT_VERSION,
+            "docs": len(self),
+            "total_length": self._base_length + self._delta_length,
+            "k1": self.k1,
+            "b": self.b,
+        }
+        save_arrays(directory, arrays, meta)
+        self._open_base(directory, meta, mmap_mode="r")
+        self._clear_delta()
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "FactIndex":
+        """Open an index written by save(), memory-mapped unless mmap=False"""
+        directory = Path(path)
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        if meta["version"] != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format version {meta['version']}")
+
+        index = cls(k1=meta["k1"], b=meta["b"])
+        index._open_base(directory, meta, mmap_mode="r" if mmap else None)
+        return index
+
+    def _open_base(self, directory: Path, meta: dict, mmap_mode: Optional[str]) -> None:
+        """Point the base segment at the arrays saved under directory"""
+
+        def array(name: str) -> np.ndarray:
+            return np.load(directory / f"{name}.npy", mmap_mode=mmap_mode)
+
+        self._base_docs = meta["docs"]
+        self._base_length = meta["total_length"]
+        self._terms = BlobStrings(array("terms"), array("term_offsets"))
+        self._posting_offsets = array("posting_offsets")
+        self._doc_ids = array("doc_ids")
+        self._tfs = array("tfs")
+        self._doc_lengths = array("doc_lengths")
+        self._facts = BlobStrings(array("facts"), array("fact_offsets"))
+
+    def _clear_delta(self) -> None:
+        self._delta_postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._delta_lengths: List[int] = []
+        self._delta_facts: List[str] = []
+        self._delta_length = 0
@@ -0,0 +1,299 @@
+"""
+In-process stand-in for the public APIs used by api_utils.
+
+FakeApiServer serves the joke, dog.ceo, catfact.ninja, CoinGecko,
+OpenWeatherMap and NASA endpoints from a local ThreadingHTTPServer with
+configurable latency, error rate and payload sizes, so the fetchers can be
+tested and benchmarked without network access.
+"""
+
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+# api_utils constant name -> path served by the fake server
+API_PATHS = {
+    "JOKE_API_URL": "/random_joke",
+    "DOG_API_URL": "/api/breeds/image/random",
+    "WEATHER_API_URL": "/data/2.5/weather",
+    "CAT_FACTS_API_URL": "/facts",
+    "CRYPTO_API_URL": "/api/v3/simple/price",
+    "NASA_API_URL": "/search",
+}
+
+
+class FakeApiServer:
+    """Local HTTP server mimicking the upstream APIs used by api_utils
+
+    latency is a fixed delay in seconds or a (low, high) range sampled per
+    request; error_rate is the fraction of requests answered with a 503.
+    Payload sizes are set with cat_fact_total, dog_max_count, nasa_items and
+    nasa_page_bytes. JSON responses carry an ETag and honor If-None-Match.
+    """
+
+    def __init__(
+        self,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        error_rate: float = 0.0,
+        cat_fact_total: int = 332,
+        dog_max_count: int = 50,
+        nasa_items: int = 100,
+        nasa_page_bytes: int = 50_000,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.cat_fact_total = cat_fact_total
+        self.dog_max_count = dog_max_count
+        self.nasa_items = nasa_items
+        self.nasa_page_bytes = nasa_page_bytes
+        self.request_counts: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._address = (host, port)
+        self._server: Optional["_FakeHTTPServer"] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        if self._server is None:
+            raise RuntimeError("Server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def api_urls(self) -> Dict[str, str]:
+        """api_utils endpoint constants mapped to this server's URLs"""
+        return {name: self.url + path for name, path in API_PATHS.items()}
+
+    def start(self) -> "FakeApiServer":
+        """Start serving on a background daemon thread"""
+        if self._server is None:
+            handler = type("_BoundHandler", (_FakeApiHandler,), {"api": self})
+            self._server = _FakeHTTPServer(self._address, handler)
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down and release its socket"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> "FakeApiServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @contextmanager
+    def patch_module(self, module) -> Iterator["FakeApiServer"]:
+        """Point a module's endpoint constants (e.g. api_utils) at this server"""
+        originals = {name: getattr(module, name) for name in API_PATHS}
+        for name, url in self.api_urls().items():
+            setattr(module, name, url)
+        try:
+            yield self
+        finally:
+            for name, url in originals.items():
+                setattr(module, name, url)
+
+    def _count(self, path: str) -> None:
+        with self._lock:
+            self.request_counts[path] = self.request_counts.get(path, 0) + 1
+
+    def _delay(self) -> float:
+        with self._lock:
+            if isinstance(self.latency, tuple):
+                return self._random.uniform(*self.latency)
+            return self.latency
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer tuned for load tests"""
+
+    daemon_threads = True
+    # The default backlog of 5 makes bursts of connects wait on SYN retries
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading early (head-only scraping) hang up mid-response
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+
+def _price_for(coin: str, currency: str) -> float:
+    """Deterministic pseudo price so repeated calls agree"""
+    digest = hashlib.sha256(f"{coin}:{currency}".encode()).digest()
+    return round(int.from_bytes(digest[:4], "big") / 1000, 2)
+
+
+class _FakeApiHandler(BaseHTTPRequestHandler):
+    """Request handler; `api` is bound to the owning FakeApiServer"""
+
+    api: FakeApiServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        parsed = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path
+        self.api._count(path)
+
+        delay = self.api._delay()
+        if delay:
+            time.sleep(delay)
+
+        if self.api._should_fail():
+            self._send_json({"error": "injected failure"}, status=503)
+            return
+
+        if path == API_PATHS["JOKE_API_URL"]:
+            self._random_joke()
+        elif path.startswith(API_PATHS["DOG_API_URL"] + "/"):
+            self._dog_images(path.rsplit("/", 1)[-1])
+        elif path == API_PATHS["WEATHER_API_URL"]:
+            self._weather(query)
+        elif path == API_PATHS["CAT_FACTS_API_URL"]:
+            self._cat_facts(query)
+        elif path == API_PATHS["CRYPTO_API_URL"]:
+            self._crypto_prices(query)
+        elif path == API_PATHS["NASA_API_URL"]:
+            self._nasa_search(query)
+        elif path.startswith("/asset/"):
+            self._nasa_page(path.rsplit("/", 1)[-1])
+        else:
+            self._send_json({"message": "Not Found"}, status=404)
+
+    def _random_joke(self):
+        number = self.api._random.randint(1, 10_000)
+        self._send_json(
+            {
+                "id": number,
+                "type": "general",
+                "setup": f"Setup number {number}?",
+                "punchline": f"Punchline number {number}.",
+            }
+        )
+
+    def _dog_images(self, count: str):
+        try:
+            count = int(count)
+        except ValueError:
+            self._send_json({"status": "error", "message": "Bad count"}, status=400)
+            return
+        count = max(1, min(count, self.api.dog_max_count))
+        images = [
+            f"https://images.dog.ceo/breeds/fake/n{self.api._random.getrandbits(40)}.jpg"
+            for _ in range(count)
+        ]
+        self._send_json({"message": images, "status": "success"})
+
+    def _weather(self, query: Dict[str, str]):
+        if not query.get("appid"):
+            self._send_json({"cod": 401, "message": "Invalid API key"}, status=401)
+            return
+        city = query.get("q", "")
+        seed = int(hashlib.sha256(city.lower().encode()).hexdigest()[:8], 16)
+        self._send_json(
+            {
+                "name": city,
+                "cod": 200,
+                "main": {"temp": round(seed % 400 / 10 - 5, 1), "humidity": seed % 100},
+                "weather": [{"main": "Clear", "description": "clear sky"}],
+            }
+        )
+
+    def _cat_facts(self, query: Dict[str, str]):
+        limit = max(1, int(query.get("limit", 10)))
+        page = max(1, int(query.get("page", 1)))
+        total = self.api.cat_fact_total
+        first = (page - 1) * limit
+        data = [
+            {"fact": f"Cat fact number {n + 1}.", "length": 20 + len(str(n + 1))}
+            for n in range(first, min(first + limit, total))
+        ]
+        self._send_json(
+            {
+                "current_page": page,
+                "data": data,
+                "per_page": limit,
+                "last_page": -(-total // limit),
+                "total": total,
+            }
+        )
+
+    def _crypto_prices(self, query: Dict[str, str]):
+        ids = [coin for coin in query.get("ids", "").split(",") if coin]
+        currencies = [c for c in query.get("vs_currencies", "usd").split(",") if c]
+        self._send_json(
+            {coin: {cur: _price_for(coin, cur) for cur in currencies} for coin in ids}
+        )
+
+    def _nasa_search(self, query: Dict[str, str]):
+        term = query.get("q", "")
+        items = [
+            {
+                "data": [{"title": f"{term.title()} image {n}", "nasa_id": f"id{n}"}],
+                "links": [{"href": f"{self.api.url}/asset/id{n}", "rel": "preview"}],
+            }
+            for n in range(self.api.nasa_items)
+        ]
+        self._send_json({"collection": {"items": items}})
+
+    def _nasa_page(self, asset_id: str):
+        head = (
+            "<!DOCTYPE html><html><head><title>NASA</title>"
+            f'<meta name="description" content="Description of {asset_id}">'
+            "</head><body>"
+        )
+        filler = "<p>" + "x" * max(0, self.api.nasa_page_bytes - len(head)) + "</p>"
+        body = (head + filler + "</body></html>").encode("utf-8")
+        self._send_body(body, "text/html; charset=utf-8")
+
+    def _send_json(self, payload, status: int = 200):
+        body = json.dumps(payload).encode("utf-8")
+        self._send_body(body, "application/json", status)
+
+    def _send_body(self, body: bytes, content_type: str, status: int = 200):
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
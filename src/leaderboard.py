@@ -0,0 +1,218 @@
+"""
+Leaderboard over score files: global top-N, per-player top-k and ranks.
+
+Leaderboard.from_csv() builds it in one pass over a name,score CSV, keeping
+a bounded min-heap of each player's k best scores. save() writes it as flat
+NumPy arrays in rank order that load() memory-maps back, so rank and top-N
+queries never rescan the raw CSV.
+"""
+
+import csv
+import heapq
+import json
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .array_utils import BlobStrings, pack_strings, save_arrays
+    from .data_file_utils import open_input
+except ImportError:  # imported with src/ on sys.path, as in the notebooks
+    from array_utils import BlobStrings, pack_strings, save_arrays
+    from data_file_utils import open_input
+
+_FORMAT_VERSION = 1
+
+
+class _Permuted:
+    """Read-only view of seq in the order given by an index array"""
+
+    def __init__(self, seq, order: np.ndarray):
+        self._seq = seq
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index: int):
+        return self._seq[int(self._order[index])]
+
+
+class Leaderboard:
+    """Per-player top-k scores with global ranking by best score
+
+    Players are ranked by best score, highest first, ties broken by name;
+    tied players share a rank (1, 2, 2, 4). Adds go to per-player heaps;
+    queries use rank-ordered arrays rebuilt after adds, or memory-mapped
+    after load(). A loaded leaderboard accepts further adds.
+    """
+
+    def __init__(self, k: int = 10):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self._heaps: Optional[Dict[str, List[int]]] = {}
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+
+    @classmethod
+    def from_csv(cls, input_path, k: int = 10) -> "Leaderboard":
+        """Build a leaderboard from a name,score CSV, plain or gzip/bz2/xz"""
+        board = cls(k)
+        with open_input(input_path) as file:
+            board.add_many(
+                (row["name"], int(row["score"])) for row in csv.DictReader(file)
+            )
+        return board
+
+    def __len__(self) -> int:
+        if self._heaps is not None:
+            return len(self._heaps)
+        return len(self._arrays["best"])
+
+    def __contains__(self, player: str) -> bool:
+        return self._position(player) is not None
+
+    def add(self, player: str, score: int) -> None:
+        """Record one score"""
+        self.add_many([(player, score)])
+
+    def add_many(self, rows: Iterable[Tuple[str, int]]) -> None:
+        """Record every (player, score) in rows"""
+        heaps = self._thaw()
+        k = self.k
+        for player, score in rows:
+            heap = heaps.get(player)
+            if heap is None:
+                heaps[player] = [score]
+            elif len(heap) < k:
+                heapq.heappush(heap, score)
+            elif score > heap[0]:
+                heapq.heapreplace(heap, score)
+
+    def top(self, n: int = 10) -> List[Tuple[str, int]]:
+        """The n best players as (player, best score), best first"""
+        arrays = self._freeze()
+        names = self._names()
+        n = max(0, min(n, len(arrays["best"])))
+        return [(names[i].decode("utf-8"), int(arrays["best"][i])) for i in range(n)]
+
+    def best(self, player: str) -> int:
+        """Best score of a player"""
+        return int(self._freeze()["best"][self._require(player)])
+
+    def scores(self, player: str) -> List[int]:
+        """A player's top-k scores, highest first"""
+        arrays = self._freeze()
+        position = self._require(player)
+        start = arrays["score_offsets"][position]
+        end = arrays["score_offsets"][position + 1]
+        return arrays["scores"][start:end].tolist()
+
+    def rank(self, player: str) -> int:
+        """1-based rank of a player; tied players share the best rank"""
+        best = self._freeze()["best"]
+        # best is sorted descending; its reversed view is ascending without
+        # a copy, so this counts the higher scores in O(log players)
+        higher = len(best) - np.searchsorted(
+            best[::-1], best[self._require(player)], side="right"
+        )
+        return int(higher) + 1
+
+    def save(self, path: str) -> None:
+        """Write the leaderboard as flat arrays under path
+
+        Files are replaced atomically, so a loaded leaderboard can be saved
+        back to the directory it is memory-mapped from.
+        """
+        meta = {"version": _FORMAT_VERSION, "k": self.k, "players": len(self)}
+        save_arrays(Path(path), self._freeze(), meta)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "Leaderboard":
+        """Open a leaderboard written by save(), memory-mapped unless mmap=False"""
+        directory = Path(path)
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        if meta["version"] != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported leaderboard version {meta['version']}")
+
+        mode = "r" if mmap else None
+        board = cls(meta["k"])
+        board._heaps = None
+        board._arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode=mode)
+            for name in (
+                "names",
+                "name_offsets",
+                "best",
+                "score_offsets",
+                "scores",
+                "name_order",
+            )
+        }
+        return board
+
+    def _names(self) -> BlobStrings:
+        """Player names (utf-8) in rank order"""
+        arrays = self._freeze()
+        return BlobStrings(arrays["names"], arrays["name_offsets"])
+
+    def _position(self, player: str) -> Optional[int]:
+        """Rank-order position of a player, or None if unknown"""
+        arrays = self._freeze()
+        by_name = _Permuted(self._names(), arrays["name_order"])
+        key = player.encode("utf-8")
+        index = bisect_left(by_name, key)
+        if index == len(by_name) or by_name[index] != key:
+            return None
+        return int(arrays["name_order"][index])
+
+    def _require(self, player: str) -> int:
+        position = self._position(player)
+        if position is None:
+            raise KeyError(player)
+        return position
+
+    def _thaw(self) -> Dict[str, List[int]]:
+        """Per-player heaps, rebuilt from the arrays after load()"""
+        if self._heaps is None:
+            names = self._names()
+            offsets = self._arrays["score_offsets"]
+            scores = self._arrays["scores"]
+            self._heaps = {}
+            for position in range(len(names)):
+                heap = scores[offsets[position] : offsets[position + 1]].tolist()
+                heapq.heapify(heap)
+                self._heaps[names[position].decode("utf-8")] = heap
+        self._arrays = None
+        return self._heaps
+
+    def _freeze(self) -> Dict[str, np.ndarray]:
+        """Rank-ordered arrays, rebuilt from the heaps after adds"""
+        if self._arrays is None:
+            players = list(self._heaps)
+            bests = [max(heap) for heap in self._heaps.values()]
+            order = sorted(range(len(players)), key=lambda i: (-bests[i], players[i]))
+
+            names, name_offsets = pack_strings(
+                [players[i].encode("utf-8") for i in order]
+            )
+            score_lists = [sorted(self._heaps[players[i]], reverse=True) for i in order]
+            score_offsets = np.zeros(len(order) + 1, dtype=np.int64)
+            if score_lists:
+                score_offsets[1:] = np.cumsum([len(s) for s in score_lists])
+            name_order = sorted(range(len(order)), key=lambda r: players[order[r]])
+
+            self._arrays = {
+                "names": names,
+                "name_offsets": name_offsets,
+                "best": np.array([bests[i] for i in order], dtype=np.int64),
+                "score_offsets": score_offsets,
+                "scores": np.array(
+                    [score for scores in score_lists for score in scores],
+                    dtype=np.int64,
+                ),
+                "name_order": np.array(name_order, dtype=np.int64),
+            }
+        return self._arrays
@@ -1,8 +1,12 @@
-import numpy as np
+"""
+NumPy demonstration helpers; numpy is imported on first use.
+"""
 
 
 def create_sample_data():
     """Create sample data for demonstration"""
+    import numpy as np
+
     # Sample array operations
     arr = np.arange(1, 17).reshape(4, 4)
     return arr
@@ -10,6 +14,8 @@ def create_sample_data():
 
 def array_operations_demo():
     """Demonstrate common array operations"""
+    import numpy as np
+
     A = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
     B = np.array([[5, 4, 3], [7, 6, 5], [9, 8, 7]])
 
@@ -0,0 +1,211 @@
+"""
+Append-only columnar store for cryptocurrency price ticks.
+
+Timestamps are int64 epoch nanoseconds (UTC) and each coin's prices are a
+float64 column, so a tick costs 8 bytes per column instead of a dict.
+Stores live in memory or in a directory of memory-mapped column files.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_FORMAT_VERSION = 1
+TimeLike = Union[int, datetime, str]
+
+
+def to_epoch_ns(value: TimeLike) -> int:
+    """Epoch nanoseconds for an int (passed through), datetime or ISO string
+
+    Naive datetimes and strings are taken as local time, matching the
+    timestamps written by api_utils.track_crypto_prices.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+class PriceStore:
+    """Append-only tick store with one growable float64 column per coin
+
+    With path=None the columns are in-memory arrays; otherwise they are
+    memory-mapped files under path (created if missing, reopened if not).
+    Capacity doubles as ticks are appended, so appends are amortized O(1).
+    """
+
+    def __init__(
+        self,
+        coins: Optional[Iterable[str]] = None,
+        path: Optional[str] = None,
+        initial_capacity: int = 1024,
+    ):
+        self.path = Path(path) if path else None
+        meta_path = self.path / "meta.json" if self.path else None
+
+        if meta_path is not None and meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta["version"] != _FORMAT_VERSION:
+                raise ValueError(f"Unsupported store version {meta['version']}")
+            if coins is not None and list(coins) != meta["coins"]:
+                raise ValueError(f"Store at {path} tracks coins {meta['coins']}")
+            self.coins: List[str] = meta["coins"]
+            self._count = meta["count"]
+            self._capacity = meta["capacity"]
+        else:
+            if not coins:
+                raise ValueError("coins are required to create a new store")
+            self.coins = list(coins)
+            self._count = 0
+            self._capacity = max(1, initial_capacity)
+            if self.path:
+                self.path.mkdir(parents=True, exist_ok=True)
+
+        self._timestamps, self._prices = self._allocate(self._capacity)
+        if self.path and not meta_path.exists():
+            self.flush()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "PriceStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    @property
+    def bytes_per_tick(self) -> int:
+        """Storage cost of one tick"""
+        return 8 * (1 + len(self.coins))
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Epoch-nanosecond timestamps of all ticks (a view, not a copy)"""
+        return self._timestamps[: self._count]
+
+    def prices(self, coin: str) -> np.ndarray:
+        """Prices of one coin for all ticks (a view, not a copy)"""
+        return self._prices[self.coins.index(coin)][: self._count]
+
+    def append(
+        self, prices: Dict[str, Optional[float]], timestamp: Optional[TimeLike] = None
+    ) -> None:
+        """Add one tick; coins missing from prices (or None) are stored as NaN"""
+        ts = to_epoch_ns(timestamp) if timestamp is not None else time.time_ns()
+        if self._count and ts < self._timestamps[self._count - 1]:
+            raise ValueError("Timestamps must be non-decreasing")
+        if self._count == self._capacity:
+            self._grow()
+
+        self._timestamps[self._count] = ts
+        for column, coin in zip(self._prices, self.coins):
+            price = prices.get(coin)
+            column[self._count] = np.nan if price is None else price
+        self._count += 1
+
+    def append_record(self, record: Dict, currency: str = "usd") -> None:
+        """Add a record produced by track_crypto_prices/stream_crypto_prices"""
+        prices = {coin: record.get(f"{coin}_{currency}") for coin in self.coins}
+        timestamp = datetime.strptime(record["timestamp"], "%Y-%m-%d %H:%M:%S")
+        self.append(prices, timestamp)
+
+    def time_range(
+        self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None
+    ) -> Tuple[int, int]:
+        """Row bounds [first, last) of ticks with start <= timestamp < end"""
+        timestamps = self.timestamps
+        first = 0 if start is None else np.searchsorted(timestamps, to_epoch_ns(start))
+        last = (
+            self._count
+            if end is None
+            else np.searchsorted(timestamps, to_epoch_ns(end), side="left")
+        )
+        return int(first), int(max(first, last))
+
+    def slice(
+        self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """(timestamps, {coin: prices}) views for start <= timestamp < end"""
+        first, last = self.time_range(start, end)
+        return (
+            self._timestamps[first:last],
+            {
+                coin: column[first:last]
+                for coin, column in zip(self.coins, self._prices)
+            },
+        )
+
+    def to_dataframe(
+        self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None
+    ) -> pd.DataFrame:
+        """DataFrame over the store's buffers (UTC DatetimeIndex, no copies)"""
+        timestamps, columns = self.slice(start, end)
+        # Viewing as a tz-aware dtype labels the epoch values UTC in place;
+        # tz_localize("UTC") would copy the whole column
+        values = pd.array(timestamps.view("datetime64[ns]"), copy=False)
+        index = pd.DatetimeIndex(
+            values.view(pd.DatetimeTZDtype("ns", "UTC")), copy=False, name="timestamp"
+        )
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    def flush(self) -> None:
+        """Persist pending writes and the tick count (no-op in memory)"""
+        if not self.path:
+            return
+        self._timestamps.flush()
+        for column in self._prices:
+            column.flush()
+        meta = {
+            "version": _FORMAT_VERSION,
+            "coins": self.coins,
+            "count": self._count,
+            "capacity": self._capacity,
+        }
+        tmp_path = self.path / "meta.json.tmp"
+        tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+        tmp_path.replace(self.path / "meta.json")
+
+    def _allocate(self, capacity: int) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """Column buffers of the given capacity (files are extended as needed)"""
+        if not self.path:
+            timestamps = np.zeros(capacity, dtype=np.int64)
+            prices = [np.full(capacity, np.nan) for _ in self.coins]
+            return timestamps, prices
+
+        files = [self.path / "timestamps.i8"]
+        files += [self.path / f"prices_{i}.f8" for i in range(len(self.coins))]
+        columns = []
+        for file_path, dtype in zip(files, [np.int64] + [np.float64] * len(self.coins)):
+            with open(file_path, "ab") as file:
+                if file.tell() < capacity * 8:
+                    file.truncate(capacity * 8)
+            columns.append(
+                np.memmap(file_path, dtype=dtype, mode="r+", shape=(capacity,))
+            )
+        return columns[0], columns[1:]
+
+    def _grow(self) -> None:
+        """Double capacity, keeping existing ticks"""
+        capacity = self._capacity * 2
+        if self.path:
+            self.flush()
+            self._timestamps, self._prices = self._allocate(capacity)
+        else:
+            timestamps, prices = self._allocate(capacity)
+            timestamps[: self._count] = self._timestamps[: self._count]
+            for new, old in zip(prices, self._prices):
+                new[: self._count] = old[: self._count]
+            self._timestamps, self._prices = timestamps, prices
+        self._capacity = capacity
+        if self.path:
+            self.flush()
@@ -1,9 +1,15 @@
-import matplotlib.pyplot as plt
-import numpy as np
+"""
+Plotting helpers.
+
+matplotlib.pyplot takes around a second to import, so it and numpy are
+imported inside the functions that draw rather than with this module.
+"""
 
 
 def create_basic_plot(data, title="Basic Plot", xlabel="Index", ylabel="Value"):
     """Create a basic matplotlib plot"""
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     plt.plot(data)
     plt.title(title)
@@ -15,6 +21,9 @@ def create_basic_plot(data, title="Basic Plot", xlabel="Index", ylabel="Value"):
 
 def customize_plot():
     """Demonstrate plot customization"""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     x = np.linspace(0, 10, 100)
     y = np.sin(x)
 
@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import patch
+from src import api_utils
+from src.fake_api_server import FakeApiServer
+from src.api_benchmark import (
+    DEFAULT_FETCHERS,
+    benchmark_fetcher,
+    format_report,
+    run_benchmark,
+)
+
+
+def test_benchmark_fetcher_summary():
+    stats = benchmark_fetcher(lambda: [1], calls=20, concurrency=4)
+    assert stats["calls"] == 20
+    assert stats["failures"] == 0
+    assert stats["p50"] <= stats["p95"] <= stats["p99"] <= stats["max"]
+
+
+def test_benchmark_fetcher_counts_failures():
+    stats = benchmark_fetcher(lambda: None, calls=5, concurrency=2)
+    assert stats["failures"] == 5
+
+
+def test_run_benchmark_against_fake_server():
+    original = api_utils.CRYPTO_API_URL
+    results = run_benchmark(
+        {name: DEFAULT_FETCHERS[name] for name in ("get_crypto_prices", "get_joke")},
+        calls=10,
+        concurrency=4,
+        latency=0.001,
+    )
+
+    assert api_utils.CRYPTO_API_URL == original
+    assert results["get_crypto_prices"]["failures"] == 0
+    assert results["get_joke"]["throughput"] > 0
+    assert "get_joke" in format_report(results)
+
+
+def test_run_benchmark_bypasses_coalescing_and_restores_settings(tmp_path):
+    servers = []
+
+    class RecordingServer(FakeApiServer):
+        def __enter__(self):
+            servers.append(self)
+            return super().__enter__()
+
+    session = api_utils.configure_session(pool_maxsize=3)
+    cache = api_utils.enable_response_cache(str(tmp_path))
+    batcher = api_utils.enable_price_batching()
+    flight = api_utils._single_flight
+    coalesced = flight.coalesced
+    try:
+        with patch("src.api_benchmark.FakeApiServer", RecordingServer):
+            results = run_benchmark(
+                {"get_crypto_prices": DEFAULT_FETCHERS["get_crypto_prices"]},
+                calls=40,
+                concurrency=8,
+                latency=0.01,
+            )
+
+        assert results["get_crypto_prices"]["failures"] == 0
+        # Every call reached the server instead of sharing a response
+        assert sum(servers[0].request_counts.values()) == 40
+        assert flight.coalesced == coalesced
+        assert api_utils.get_session() is session
+        assert api_utils._session_config["pool_maxsize"] == 3
+        assert api_utils._response_cache is cache
+        assert api_utils._price_batcher is batcher
+        assert api_utils._single_flight is flight
+    finally:
+        api_utils.disable_response_cache()
+        api_utils.disable_price_batching()
+        api_utils.configure_session()
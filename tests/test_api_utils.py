@@ -1,33 +1,103 @@
+import asyncio
+import gzip
+import json
+import threading
+import time
 import pytest
 import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
+from src import api_utils
+from src.fake_api_server import FakeApiServer
 from src.api_utils import (
+    async_get_cat_facts,
+    async_get_crypto_prices,
+    async_make_api_request,
+    set_async_concurrency,
+    configure_session,
+    get_session,
+    close_session,
+    collect_cat_facts_dataset,
+    collect_cat_facts_to_disk,
+    iter_stored_cat_facts,
+    disable_response_cache,
+    disable_price_batching,
+    use_cassette,
+    Cassette,
+    disable_metrics,
+    enable_metrics,
+    LatencyHistogram,
+    configure_circuit_breaker,
+    configure_retries,
+    get_circuit_breaker_states,
+    get_retry_stats,
+    reset_circuit_breakers,
+    enable_price_batching,
+    get_coalescing_stats,
+    SingleFlight,
+    enable_response_cache,
+    get_cache_stats,
+    ResponseCache,
+    TokenBucket,
+    WEATHER_API_URL,
     make_api_request,
+    nasa_image_search,
+    stream_crypto_prices,
+    track_crypto_prices,
+    async_stream_crypto_prices,
     get_joke,
     get_dog_images,
+    iter_dog_images,
     get_weather,
+    get_weather_bulk,
+    clear_weather_cache,
     get_crypto_prices,
 )
 
 
-@patch("src.api_utils.requests.get")
-def test_make_api_request_success(mock_get):
+@patch("src.api_utils.get_session")
+def test_make_api_request_success(mock_session):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    mock_session.return_value.get.return_value = mock_response
 
     response = make_api_request("http://test.com")
     assert response.status_code == 200
 
 
-@patch("src.api_utils.requests.get")
-def test_make_api_request_timeout(mock_get):
-    mock_get.side_effect = requests.exceptions.Timeout
+@patch("src.api_utils.get_session")
+def test_make_api_request_timeout(mock_session):
+    mock_session.return_value.get.side_effect = requests.exceptions.Timeout
     response = make_api_request("http://test.com")
     assert response is None
 
 
+def test_get_session_is_reused():
+    close_session()
+    assert get_session() is get_session()
+    close_session()
+
+
+def test_configure_session_pool_sizes():
+    session = configure_session(pool_connections=4, pool_maxsize=8)
+    adapter = session.get_adapter("https://example.com")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 8
+    assert get_session() is session
+
+    close_session()
+    assert get_session() is not session
+    configure_session()
+
+
+def test_configure_session_invalid():
+    with pytest.raises(ValueError):
+        configure_session(pool_maxsize=0)
+
+
 @patch("src.api_utils.make_api_request")
 def test_get_joke(mock_request):
     mock_response = MagicMock()
@@ -95,3 +165,778 @@ def test_get_crypto_prices(mock_request):
     prices = get_crypto_prices(["bitcoin", "ethereum"])
     assert prices is not None
     assert prices["bitcoin"]["usd"] == 50000
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Tiny local stand-in for the upstream JSON APIs"""
+
+    def do_GET(self):
+        parsed = urlsplit(self.path)
+        query = parse_qs(parsed.query)
+        if parsed.path == "/facts":
+            page = int(query["page"][0])
+            self._send_json({"current_page": page, "data": [{"fact": f"fact {page}"}]})
+        elif parsed.path == "/price":
+            ids = query["ids"][0].split(",")
+            self._send_json({coin: {"usd": 100.0} for coin in ids})
+        elif parsed.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in (b'{"setup": "a", ', b'"punchline": "b"}'):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        elif parsed.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/chunked")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif parsed.path == "/slow":
+            time.sleep(0.5)
+            self._send_json({})
+        else:
+            self.send_error(404)
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_make_api_request_chunked_and_redirect(stand_in_server):
+    response = asyncio.run(async_make_api_request(f"{stand_in_server}/redirect"))
+    assert response.status_code == 200
+    assert response.json() == {"setup": "a", "punchline": "b"}
+
+
+def test_async_make_api_request_http_error(stand_in_server):
+    assert asyncio.run(async_make_api_request(f"{stand_in_server}/missing")) is None
+
+
+def test_async_make_api_request_timeout(stand_in_server):
+    url = f"{stand_in_server}/slow"
+    assert asyncio.run(async_make_api_request(url, timeout=0.1)) is None
+
+
+def test_async_fetchers_fan_out(stand_in_server, monkeypatch):
+    monkeypatch.setattr("src.api_utils.CAT_FACTS_API_URL", f"{stand_in_server}/facts")
+    monkeypatch.setattr("src.api_utils.CRYPTO_API_URL", f"{stand_in_server}/price")
+    set_async_concurrency(3)
+
+    async def fan_out():
+        pages = await asyncio.gather(
+            *(async_get_cat_facts(limit=1, page=p) for p in range(1, 11))
+        )
+        prices = await async_get_crypto_prices(["bitcoin", "dogecoin"])
+        return pages, prices
+
+    try:
+        pages, prices = asyncio.run(fan_out())
+    finally:
+        set_async_concurrency(20)
+
+    assert [page["data"][0]["fact"] for page in pages] == [
+        f"fact {p}" for p in range(1, 11)
+    ]
+    assert prices == {"bitcoin": {"usd": 100.0}, "dogecoin": {"usd": 100.0}}
+
+
+def test_set_async_concurrency_invalid():
+    with pytest.raises(ValueError):
+        set_async_concurrency(0)
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20, capacity=1)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    # The first token is free, the next four are spaced 1/20s apart
+    assert time.monotonic() - start >= 0.18
+
+
+def test_token_bucket_invalid():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+@patch("src.api_utils.get_cat_facts")
+def test_collect_cat_facts_dataset_keeps_page_order(mock_facts):
+    def fake_page(limit, page):
+        # Earlier pages answer slower so completion order differs from page order
+        time.sleep(0.05 / page)
+        return {"data": [{"fact": f"p{page}-{i}"} for i in range(limit)]}
+
+    mock_facts.side_effect = fake_page
+    facts = collect_cat_facts_dataset(
+        target_count=25, max_in_flight=3, requests_per_second=100, page_size=10
+    )
+
+    assert len(facts) == 25
+    assert facts[0] == "p1-0"
+    assert facts[10] == "p2-0"
+    assert facts[24] == "p3-4"
+
+
+@patch("src.api_utils.get_cat_facts")
+def test_collect_cat_facts_dataset_stops_on_empty_page(mock_facts):
+    mock_facts.side_effect = lambda limit, page: {
+        "data": [{"fact": f"p{page}"}] if page <= 2 else []
+    }
+    facts = collect_cat_facts_dataset(
+        target_count=100, max_in_flight=2, requests_per_second=100, page_size=1
+    )
+    assert facts == ["p1", "p2"]
+
+
+def _cacheable_response(status_code=200, body=b'{"temp": 20}', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://api.example.com/weather?q=Paris"
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response._content = body
+    return response
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    cache = enable_response_cache(
+        cache_dir=str(tmp_path), ttls={"https://api.example.com/random": 0}
+    )
+    yield cache
+    disable_response_cache()
+
+
+@patch("src.api_utils.get_session")
+def test_response_cache_hit_and_miss(mock_session, response_cache):
+    mock_session.return_value.get.return_value = _cacheable_response()
+
+    first = make_api_request("https://api.example.com/weather", {"q": "Paris"})
+    second = make_api_request("https://api.example.com/weather", {"q": "Paris"})
+
+    assert first.json() == second.json() == {"temp": 20}
+    assert mock_session.return_value.get.call_count == 1
+    stats = get_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+@patch("src.api_utils.get_session")
+def test_response_cache_revalidates_with_etag(mock_session, response_cache):
+    get = mock_session.return_value.get
+    get.return_value = _cacheable_response(headers={"ETag": '"v1"'})
+    response_cache.default_ttl = 0.01
+    make_api_request("https://api.example.com/weather", {"q": "Paris"})
+    time.sleep(0.02)
+
+    get.return_value = _cacheable_response(status_code=304, body=b"")
+    response = make_api_request("https://api.example.com/weather", {"q": "Paris"})
+
+    assert response.status_code == 200
+    assert response.json() == {"temp": 20}
+    assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert get_cache_stats()["revalidations"] == 1
+
+
+@patch("src.api_utils.get_session")
+def test_response_cache_skips_zero_ttl_endpoints(mock_session, response_cache):
+    mock_session.return_value.get.return_value = _cacheable_response()
+    make_api_request("https://api.example.com/random")
+    make_api_request("https://api.example.com/random")
+    assert mock_session.return_value.get.call_count == 2
+
+
+def test_response_cache_disk_tier_and_lru(tmp_path):
+    key = ResponseCache.make_key("https://a", {"b": 1, "a": 2})
+    assert key == ResponseCache.make_key("https://a", {"a": "2", "b": "1"})
+
+    cache = ResponseCache(max_entries=1, cache_dir=str(tmp_path))
+    entry = {
+        "status_code": 200,
+        "url": "https://a",
+        "headers": {},
+        "content": b"payload",
+        "expires_at": time.time() + 60,
+    }
+    cache.put(key, entry)
+    cache.put("other", dict(entry, content=b"other"))
+    assert cache.stats()["entries"] == 1
+
+    # Evicted from memory, but a fresh cache instance still finds it on disk
+    reloaded = ResponseCache(cache_dir=str(tmp_path))
+    assert reloaded.get(key)["content"] == b"payload"
+
+
+def _streamed_page(chunks, consumed):
+    page = MagicMock()
+    page.status_code = 200
+    page.encoding = "utf-8"
+
+    def iter_content(chunk_size):
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    page.iter_content.side_effect = iter_content
+    return page
+
+
+@patch("src.api_utils.get_session")
+def test_nasa_image_search_reads_only_page_head(mock_session):
+    api_response = MagicMock()
+    api_response.status_code = 200
+    api_response.json.return_value = {
+        "collection": {
+            "items": [
+                {
+                    "data": [{"title": f"Moon {i}"}],
+                    "links": [{"href": f"https://n/{i}"}],
+                }
+                for i in range(3)
+            ]
+        }
+    }
+    consumed = {}
+
+    def fake_get(url, **kwargs):
+        if not kwargs.get("stream"):
+            return api_response
+        consumed[url] = []
+        chunks = [
+            b"<html><head><title>x</title>",
+            f'<meta name="description" content="About {url}">'.encode(),
+            b"</head><body>" + b"x" * 1000,
+            b"never read",
+        ]
+        return _streamed_page(chunks, consumed[url])
+
+    mock_session.return_value.get.side_effect = fake_get
+    records = nasa_image_search(limit=3, per_host_rate=100)
+
+    assert [r["title"] for r in records] == ["Moon 0", "Moon 1", "Moon 2"]
+    assert records[1]["description"] == "About https://n/1"
+    assert all(len(chunks) == 2 for chunks in consumed.values())
+
+
+@patch("src.api_utils.get_session")
+def test_nasa_image_search_keeps_error_pages(mock_session):
+    api_response = MagicMock()
+    api_response.status_code = 200
+    api_response.json.return_value = {
+        "collection": {
+            "items": [
+                {
+                    "data": [{"title": f"Moon {i}"}],
+                    "links": [{"href": f"https://n/{i}"}],
+                }
+                for i in range(2)
+            ]
+        }
+    }
+    pages = {
+        "https://n/0": (404, [b"<html><head><title>Not found</title></head>"]),
+        "https://n/1": (503, [b'<head><meta name="description" content="Busy">']),
+    }
+
+    def fake_get(url, **kwargs):
+        if not kwargs.get("stream"):
+            return api_response
+        status, chunks = pages[url]
+        page = _streamed_page(chunks, [])
+        page.status_code = status
+        return page
+
+    mock_session.return_value.get.side_effect = fake_get
+    metrics = enable_metrics()
+    try:
+        records = nasa_image_search(limit=2, per_host_rate=100)
+        snapshot = metrics.snapshot()
+    finally:
+        disable_metrics()
+        reset_circuit_breakers()
+
+    # Like the original scraper, an error page still yields a record
+    assert [r["description"] for r in records] == ["No description found", "Busy"]
+    assert snapshot["scrape:n"]["errors"] == {"HTTP 404": 1, "HTTP 503": 1}
+
+
+class _FakeClock:
+    """Stand-in for the time module whose clock only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@patch("src.api_utils.get_crypto_prices")
+def test_track_crypto_prices_does_not_drift(mock_prices):
+    clock = _FakeClock()
+
+    def slow_prices(coins):
+        clock.now += 0.03
+        return {"bitcoin": {"usd": 1.0}}
+
+    mock_prices.side_effect = slow_prices
+    with patch.object(api_utils, "time", clock):
+        records = track_crypto_prices(
+            ["bitcoin", "ethereum"], interval=0.1, iterations=4
+        )
+
+    assert len(records) == 4
+    assert records[0].keys() == {"timestamp", "bitcoin_usd", "ethereum_usd"}
+    assert records[0]["ethereum_usd"] is None
+    # Fetch latency overlaps the period: 3 intervals + 1 fetch, not 3 * 0.13 + 0.03
+    assert clock.sleeps == pytest.approx([0.07, 0.07, 0.07])
+    assert clock.now == pytest.approx(0.33)
+
+
+@patch("src.api_utils.get_crypto_prices")
+def test_stream_crypto_prices_flags_missed_ticks(mock_prices):
+    clock = _FakeClock()
+    calls = []
+
+    def prices(coins):
+        calls.append(1)
+        if len(calls) == 1:
+            clock.now += 0.13  # overruns ticks 1 and 2
+        return {"bitcoin": {"usd": 2.0}}
+
+    mock_prices.side_effect = prices
+    with patch.object(api_utils, "time", clock):
+        records = list(stream_crypto_prices(["bitcoin"], interval=0.05, iterations=5))
+
+    assert [r["tick"] for r in records] == [0, 3, 4]
+    assert [r["missed_ticks"] for r in records] == [0, 2, 0]
+
+
+@patch("src.api_utils.get_crypto_prices")
+def test_track_crypto_prices_zero_interval(mock_prices):
+    clock = _FakeClock()
+
+    def prices(coins):
+        clock.now += 0.01
+        return {"bitcoin": {"usd": 5.0}}
+
+    mock_prices.side_effect = prices
+    with patch.object(api_utils, "time", clock):
+        records = track_crypto_prices(["bitcoin"], interval=0, iterations=3)
+
+    assert [r["bitcoin_usd"] for r in records] == [5.0, 5.0, 5.0]
+    assert clock.sleeps == []
+
+
+@patch("src.api_utils.get_crypto_prices")
+def test_stream_crypto_prices_unbounded(mock_prices):
+    mock_prices.return_value = {"bitcoin": {"usd": 3.0}}
+    stream = stream_crypto_prices(["bitcoin"], interval=0.001)
+    first = [next(stream)["tick"] for _ in range(5)]
+    stream.close()
+    assert first == sorted(first) and len(first) == 5
+
+
+@patch("src.api_utils.async_get_crypto_prices")
+def test_async_stream_crypto_prices(mock_prices):
+    async def prices(coins):
+        return {"bitcoin": {"usd": 4.0}}
+
+    mock_prices.side_effect = prices
+
+    async def collect():
+        return [r async for r in async_stream_crypto_prices(["bitcoin"], 0.01, 3)]
+
+    records = asyncio.run(collect())
+    assert [r["bitcoin_usd"] for r in records] == [4.0, 4.0, 4.0]
+
+    async def back_to_back():
+        stream = async_stream_crypto_prices(["bitcoin"], 0, 3)
+        return [r["tick"] async for r in stream]
+
+    assert asyncio.run(back_to_back()) == [0, 1, 2]
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = []
+    gate = threading.Event()
+
+    def slow():
+        calls.append(1)
+        gate.wait(1)
+        return "shared"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["shared"] * 5
+    assert len(calls) == 1
+    assert flight.coalesced == 4
+
+
+@patch("src.api_utils.get_session")
+def test_make_api_request_coalesces_identical_calls(mock_session):
+    def slow_get(url, **kwargs):
+        time.sleep(0.05)
+        return _cacheable_response()
+
+    mock_session.return_value.get.side_effect = slow_get
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(
+            executor.map(
+                lambda _: make_api_request(WEATHER_API_URL, {"q": "Paris"}), range(4)
+            )
+        )
+
+    assert all(r.json() == {"temp": 20} for r in responses)
+    assert mock_session.return_value.get.call_count == 1
+
+
+@patch("src.api_utils.make_api_request")
+def test_price_batching_merges_coins(mock_request):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "bitcoin": {"usd": 1},
+        "ethereum": {"usd": 2},
+        "dogecoin": {"usd": 3},
+    }
+    mock_request.return_value = mock_response
+    enable_price_batching(window=0.05)
+
+    try:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(
+                executor.map(
+                    get_crypto_prices,
+                    [["bitcoin"], ["ethereum", "bitcoin"], ["dogecoin"]],
+                )
+            )
+        stats = get_coalescing_stats()
+    finally:
+        disable_price_batching()
+
+    assert mock_request.call_count == 1
+    assert mock_request.call_args.kwargs["params"]["ids"] == "bitcoin,dogecoin,ethereum"
+    assert results[0] == {"bitcoin": {"usd": 1}}
+    assert results[1] == {"ethereum": {"usd": 2}, "bitcoin": {"usd": 1}}
+    assert results[2] == {"dogecoin": {"usd": 3}}
+    assert stats["price_batches"] == 1 and stats["batched_price_calls"] == 3
+
+
+@pytest.fixture
+def fast_retries():
+    configure_retries(max_retries=3, backoff_factor=0.001)
+    configure_circuit_breaker(failure_threshold=3, reset_timeout=0.05)
+    yield
+    configure_retries()
+    configure_circuit_breaker()
+
+
+@patch("src.api_utils.get_session")
+def test_make_api_request_retries_transient_errors(mock_session, fast_retries):
+    before = get_retry_stats()
+    mock_session.return_value.get.side_effect = [
+        requests.exceptions.ConnectionError("reset"),
+        _cacheable_response(status_code=503, headers={"Retry-After": "0"}),
+        _cacheable_response(),
+    ]
+
+    response = make_api_request("https://retry.example.com/x")
+
+    assert response.json() == {"temp": 20}
+    after = get_retry_stats()
+    assert after["retries"] - before["retries"] == 2
+    assert after["retried_requests"] - before["retried_requests"] == 1
+    assert get_circuit_breaker_states()["retry.example.com"]["state"] == "closed"
+
+
+@patch("src.api_utils.get_session")
+def test_circuit_breaker_fails_fast_then_recovers(mock_session, fast_retries):
+    configure_retries(max_retries=0)
+    get = mock_session.return_value.get
+    get.side_effect = requests.exceptions.Timeout
+
+    for _ in range(3):
+        assert make_api_request("https://down.example.com/x") is None
+    assert get_circuit_breaker_states()["down.example.com"]["state"] == "open"
+
+    # Open breaker: no request reaches the session
+    assert make_api_request("https://down.example.com/x") is None
+    assert get.call_count == 3
+    assert get_circuit_breaker_states()["down.example.com"]["rejected"] == 1
+
+    # After reset_timeout one probe goes through and closes the breaker
+    time.sleep(0.06)
+    get.side_effect = None
+    get.return_value = _cacheable_response()
+    assert make_api_request("https://down.example.com/x") is not None
+    assert get_circuit_breaker_states()["down.example.com"]["state"] == "closed"
+
+
+def test_retry_policy_honors_retry_after_date():
+    from email.utils import formatdate
+
+    policy = configure_retries(max_backoff=100)
+    response = _cacheable_response(
+        status_code=429, headers={"Retry-After": formatdate(time.time() + 10)}
+    )
+    assert 8 <= policy.delay(0, response) <= 10
+    assert 0 <= policy.delay(3) <= 4.0
+    configure_retries()
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.add(ms / 1000)
+
+    assert histogram.count == 100
+    assert 0.045 <= histogram.percentile(0.50) <= 0.056
+    assert 0.09 <= histogram.percentile(0.95) <= 0.1
+    assert histogram.percentile(0.99) <= histogram.max == 0.1
+
+
+def test_metrics_record_endpoint_breakdown(stand_in_server):
+    metrics = enable_metrics()
+    try:
+        close_session()
+        for page in (1, 2):
+            make_api_request(f"{stand_in_server}/facts", {"page": page})
+        make_api_request(f"{stand_in_server}/missing")
+        snapshot = metrics.snapshot()
+        exported = json.loads(metrics.to_json())
+    finally:
+        disable_metrics()
+        close_session()
+
+    facts = snapshot[f"{stand_in_server}/facts"]
+    assert facts["requests"] == 2
+    assert facts["bytes"] > 0
+    assert facts["errors"] == {}
+    assert facts["connect_seconds"] > 0
+    assert facts["latency"]["p50"] <= facts["latency"]["p99"]
+    assert snapshot[f"{stand_in_server}/missing"]["errors"] == {"HTTP 404": 1}
+    assert exported[f"{stand_in_server}/facts"]["requests"] == 2
+
+
+@patch("src.api_utils.make_api_request")
+def test_iter_dog_images_dedupes_and_tops_up(mock_request):
+    batches = iter(
+        [
+            [f"dog{i}.jpg" for i in range(50)],
+            [f"dog{i}.jpg" for i in range(40, 90)],  # 10 duplicates
+            [f"dog{i}.jpg" for i in range(90, 140)],
+        ]
+    )
+
+    def fake_request(url):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"message": next(batches, [])}
+        return response
+
+    mock_request.side_effect = fake_request
+    images = list(iter_dog_images(120, max_workers=1))
+
+    assert len(images) == len(set(images)) == 120
+    requested = [
+        call.args[0].rsplit("/", 1)[-1] for call in mock_request.call_args_list
+    ]
+    assert requested == ["50", "50", "30"]
+
+
+@patch("src.api_utils.make_api_request")
+def test_iter_dog_images_stops_when_stalled(mock_request):
+    mock_request.return_value = None
+    assert list(iter_dog_images(200, max_workers=2, max_stalled=2)) == []
+
+
+@patch("src.api_utils.get_session")
+def test_get_weather_bulk_partial_results_and_cache(mock_session):
+    def fake_get(url, params, timeout, **kwargs):
+        if params["appid"] != "key":
+            return _cacheable_response(status_code=401, body=b"{}")
+        if params["q"] == "Atlantis":
+            return _cacheable_response(status_code=404, body=b"{}")
+        body = json.dumps({"name": params["q"]}).encode()
+        return _cacheable_response(body=body)
+
+    mock_session.return_value.get.side_effect = fake_get
+    clear_weather_cache()
+    configure_retries(max_retries=0)
+    try:
+        cities = ["Paris", "Oslo", "paris", "Atlantis", "  "]
+        results, errors = get_weather_bulk(cities, "key", max_workers=3)
+        warm, _ = get_weather_bulk(cities, "key")
+        again, _ = get_weather_bulk(["Oslo"], "key")
+        # Another key's cached payload is not served to a bad key
+        _, bad_key_errors = get_weather_bulk(["Oslo"], "bad-key")
+    finally:
+        configure_retries()
+        clear_weather_cache()
+
+    # Case variants share one fetch but every input city gets an entry
+    assert set(results) == {"Paris", "Oslo", "paris"}
+    assert results["paris"] is results["Paris"]
+    assert warm == results
+    assert results["Oslo"] == {"name": "Oslo"}
+    assert [e["city"] for e in errors] == ["Atlantis", "  "]
+    assert "404" in errors[0]["error"]
+    assert errors[1]["error"] == "Empty city name"
+    assert again == {"Oslo": {"name": "Oslo"}}
+    assert [e["city"] for e in bad_key_errors] == ["Oslo"]
+    # Paris, Oslo, Atlantis, Atlantis again on the warm call, Oslo for bad-key
+    assert mock_session.return_value.get.call_count == 5
+
+
+def _fact_pages(total):
+    def fake_page(limit, page):
+        first = (page - 1) * limit
+        return {
+            "data": [
+                {"fact": f"Fact {n}"} for n in range(first, min(first + limit, total))
+            ]
+        }
+
+    return fake_page
+
+
+@patch("src.api_utils.get_cat_facts")
+def test_collect_cat_facts_to_disk_resumes(mock_facts, tmp_path):
+    mock_facts.side_effect = _fact_pages(100)
+    options = {"max_in_flight": 2, "requests_per_second": 1000, "page_size": 10}
+
+    assert collect_cat_facts_to_disk(25, str(tmp_path), **options) == 25
+    first_run_pages = [c.kwargs["page"] for c in mock_facts.call_args_list]
+    mock_facts.reset_mock()
+
+    assert collect_cat_facts_to_disk(45, str(tmp_path), **options) == 45
+    resumed_pages = [c.kwargs["page"] for c in mock_facts.call_args_list]
+
+    assert max(first_run_pages) == 3
+    # Page 3 was cut short at fact 25, so the rerun starts inside it
+    assert min(resumed_pages) == 3
+    facts = list(iter_stored_cat_facts(str(tmp_path)))
+    assert sorted(facts, key=lambda f: int(f.split()[1])) == [
+        f"Fact {n}" for n in range(45)
+    ]
+
+    mock_facts.reset_mock()
+    assert collect_cat_facts_to_disk(45, str(tmp_path), **options) == 45
+    mock_facts.assert_not_called()
+
+
+@patch("src.api_utils.get_cat_facts")
+def test_collect_cat_facts_to_disk_dedupes_and_repairs(mock_facts, tmp_path):
+    mock_facts.side_effect = lambda limit, page: {
+        "data": [{"fact": "Same fact"}, {"fact": f"Fact {page}"}] if page < 4 else []
+    }
+    (tmp_path / "facts.jsonl").write_text(
+        '{"hash": "ab", "fact": "torn', encoding="utf-8"
+    )
+
+    stored = collect_cat_facts_to_disk(
+        100, str(tmp_path), requests_per_second=1000, page_size=2
+    )
+
+    assert stored == 4
+    assert list(iter_stored_cat_facts(str(tmp_path))) == [
+        "Same fact",
+        "Fact 1",
+        "Fact 2",
+        "Fact 3",
+    ]
+
+
+def test_cassette_record_then_replay_offline(tmp_path):
+    cassette_path = tmp_path / "session.cassette"
+    close_session()
+    with FakeApiServer(nasa_items=3, cat_fact_total=15) as server:
+        with server.patch_module(api_utils), use_cassette(str(cassette_path), "record"):
+            recorded_facts = collect_cat_facts_dataset(50, requests_per_second=1000)
+            recorded_nasa = nasa_image_search("moon", limit=3, per_host_rate=1000)
+        urls = server.api_urls()
+    close_session()
+
+    # The server is gone: everything must come from the cassette
+    with patch.multiple(api_utils, **urls), use_cassette(str(cassette_path)) as tape:
+        assert collect_cat_facts_dataset(50, requests_per_second=1000) == recorded_facts
+        assert nasa_image_search("moon", limit=3, per_host_rate=1000) == recorded_nasa
+        # Speculative page prefetches may differ between runs, so count
+        # misses only around a request that was never recorded
+        misses = tape.misses
+        assert get_crypto_prices(["bitcoin"]) is None
+        assert tape.misses == misses + 1
+
+    assert len(recorded_facts) == 15
+    assert recorded_nasa[0]["description"] == "Description of id0"
+    assert tape.played > 0
+
+
+def test_cassette_redacts_api_keys(tmp_path):
+    cassette_path = tmp_path / "weather.cassette"
+    close_session()
+    with FakeApiServer() as server:
+        with server.patch_module(api_utils), use_cassette(str(cassette_path), "record"):
+            recorded = get_weather("Paris", "SECRETKEY123")
+        urls = server.api_urls()
+    close_session()
+
+    assert recorded is not None
+    assert b"SECRETKEY123" not in gzip.decompress(cassette_path.read_bytes())
+
+    # Replay matches whatever key the offline run is configured with
+    with patch.multiple(api_utils, **urls), use_cassette(str(cassette_path)) as tape:
+        assert get_weather("Paris", "other-key") == recorded
+        assert get_weather("Oslo", "other-key") is None
+    assert tape.played == 1
+    assert tape.misses == 1
+    assert "appid=REDACTED" in tape.redact_url(f"{urls['WEATHER_API_URL']}?appid=k")
+
+
+def test_cassette_replays_repeated_requests_in_order(tmp_path):
+    cassette = Cassette(str(tmp_path / "c"), mode="record")
+    for body in (b"first", b"second"):
+        cassette.record("k", _cacheable_response(body=body))
+    cassette.save()
+
+    replay = Cassette(str(tmp_path / "c"))
+    bodies = [replay.play("k", "https://x").content for _ in range(3)]
+    assert bodies == [b"first", b"second", b"second"]
+
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / "c"), mode="stream")
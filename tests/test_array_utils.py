@@ -0,0 +1,27 @@
+import json
+from bisect import bisect_left
+import numpy as np
+from src.array_utils import BlobStrings, pack_strings, save_arrays
+
+
+def test_pack_strings_round_trip():
+    values = [b"ant", b"", b"bee", "zoë".encode("utf-8")]
+    blob, offsets = pack_strings(values)
+    strings = BlobStrings(blob, offsets)
+
+    assert offsets.tolist() == [0, 3, 3, 6, 10]
+    assert [strings[i] for i in range(len(strings))] == values
+    assert bisect_left(BlobStrings(*pack_strings([b"a", b"c", b"e"])), b"d") == 2
+    assert len(BlobStrings(*pack_strings([]))) == 0
+
+
+def test_save_arrays_over_memory_mapped_files(tmp_path):
+    save_arrays(tmp_path, {"values": np.arange(1000)}, {"version": 1})
+    mapped = np.load(tmp_path / "values.npy", mmap_mode="r")
+
+    # Replacing the files leaves the open map reading the old data
+    save_arrays(tmp_path, {"values": np.arange(5)}, {"version": 2})
+    assert mapped[-1] == 999
+    assert np.load(tmp_path / "values.npy").tolist() == [0, 1, 2, 3, 4]
+    assert json.loads((tmp_path / "meta.json").read_text()) == {"version": 2}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["meta.json", "values.npy"]
@@ -1,9 +1,22 @@
+import bz2
+import gzip
+import json
+import lzma
+import os
+import tempfile
 import pytest
 from pathlib import Path
+from src import data_file_utils
 from src.data_file_utils import (
     create_sample_directory_structure,
     move_files_by_extension,
     calculate_high_scores,
+    calculate_high_scores_multi,
+    update_high_scores,
+    detect_compression,
+    open_input,
+    move_files_bulk,
+    MoveProgress,
 )
 
 
@@ -20,4 +33,367 @@ def test_move_files_by_extension(tmp_path):
     assert moved == 4
 
 
+def _write_scores(path, rows):
+    path.write_text(
+        "name,score,level\n" + "".join(f"{n},{s},1\n" for n, s in rows),
+        encoding="utf-8",
+    )
 
+
+@pytest.mark.parametrize("chunksize", [1, 3, 1000])
+def test_calculate_high_scores_chunked_matches_csv(tmp_path, chunksize):
+    rows = [("ann", 5), ("bob", -3), ("NA", 7), ("ann", 12), ("", 1), ("bob", -1)]
+    rows += [("cy", 4), ("ann", 9), ("cy", 8)]
+    input_path = tmp_path / "scores.csv"
+    _write_scores(input_path, rows)
+
+    expected = calculate_high_scores(input_path, tmp_path / "csv.csv")
+    result = calculate_high_scores(
+        input_path, tmp_path / "chunked.csv", engine="chunked", chunksize=chunksize
+    )
+
+    assert result == expected == {"ann": 12, "bob": 0, "NA": 7, "": 1, "cy": 8}
+    assert list(result) == list(expected)
+    assert (tmp_path / "chunked.csv").read_bytes() == (
+        tmp_path / "csv.csv"
+    ).read_bytes()
+
+
+def test_calculate_high_scores_rejects_bad_input(tmp_path):
+    input_path = tmp_path / "scores.csv"
+    _write_scores(input_path, [("ann", "lots")])
+    with pytest.raises(ValueError):
+        calculate_high_scores(input_path, tmp_path / "out.csv", engine="chunked")
+    with pytest.raises(ValueError):
+        calculate_high_scores(input_path, tmp_path / "out.csv", engine="fast")
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_calculate_high_scores_multi_matches_single_file(tmp_path, max_workers):
+    shards = [
+        [("ann", 5), ("bob", -3)],
+        [("cy", 4), ("ann", 2)],
+        [],
+        [("bob", 6), ("dee", 0), ("ann", 11)],
+    ]
+    paths = []
+    for number, rows in enumerate(shards):
+        paths.append(tmp_path / f"shard{number}.csv")
+        _write_scores(paths[-1], rows)
+    combined = tmp_path / "combined.csv"
+    _write_scores(combined, [row for rows in shards for row in rows])
+
+    expected = calculate_high_scores(combined, tmp_path / "single.csv")
+    result = calculate_high_scores_multi(
+        paths, tmp_path / "multi.csv", max_workers=max_workers, chunksize=2
+    )
+
+    assert list(result.items()) == list(expected.items())
+    assert (tmp_path / "multi.csv").read_bytes() == (
+        tmp_path / "single.csv"
+    ).read_bytes()
+
+
+def test_empty_input_writes_header_only(tmp_path):
+    empty = tmp_path / "empty.csv"
+    empty.write_bytes(b"")
+    for engine in ("csv", "chunked", "mmap"):
+        output = tmp_path / f"{engine}.csv"
+        assert calculate_high_scores(empty, output, engine=engine) == {}
+        assert output.read_text(encoding="utf-8").splitlines() == ["name,high_score"]
+
+    shard = tmp_path / "shard.csv"
+    _write_scores(shard, [("ann", 5)])
+    result = calculate_high_scores_multi([shard, empty], tmp_path / "multi.csv")
+    assert result == {"ann": 5}
+
+
+def test_update_high_scores_reads_only_appended_rows(tmp_path):
+    log = tmp_path / "scores.csv"
+    output = tmp_path / "high.csv"
+    state = tmp_path / "state.json"
+    _write_scores(log, [("ann", 5), ("bob", 3)])
+
+    assert update_high_scores(log, output, state) == {"ann": 5, "bob": 3}
+
+    with log.open("a", encoding="utf-8") as file:
+        file.write("ann,9,2\ncy,4,2\nbob,1")  # last row not finished yet
+    assert update_high_scores(log, output, state) == {"ann": 9, "bob": 3, "cy": 4}
+
+    with log.open("a", encoding="utf-8") as file:
+        file.write("0,2\n")  # completes "bob,10"
+    assert update_high_scores(log, output, state) == {"ann": 9, "bob": 10, "cy": 4}
+    assert json.loads(state.read_text())["offset"] == log.stat().st_size
+
+    calculate_high_scores(log, tmp_path / "full.csv")
+    assert output.read_bytes() == (tmp_path / "full.csv").read_bytes()
+
+
+@pytest.mark.parametrize("change", ["truncate", "rotate", "rewrite"])
+def test_update_high_scores_rebuilds_after_input_changes(tmp_path, change):
+    log = tmp_path / "scores.csv"
+    output = tmp_path / "high.csv"
+    state = tmp_path / "state.json"
+    _write_scores(log, [("ann", 50), ("bob", 30)])
+    update_high_scores(log, output, state)
+
+    if change == "truncate":
+        _write_scores(log, [("cy", 1)])
+    elif change == "rotate":
+        rotated = tmp_path / "new.csv"
+        _write_scores(rotated, [("cy", 1), ("ann", 2), ("bob", 3), ("dee", 4)])
+        rotated.replace(log)
+    else:  # same size, different content
+        _write_scores(log, [("cy", 10), ("dee", 20)])
+
+    expected = calculate_high_scores(log, tmp_path / "full.csv")
+    assert update_high_scores(log, output, state) == expected
+    assert output.read_bytes() == (tmp_path / "full.csv").read_bytes()
+
+
+MMAP_CASES = {
+    "plain": "name,score\nann,5\nbob,-3\nann,12\ncy,+7\n,4\nbob,-1\ncy,007",
+    "crlf_and_blank_lines": "name,score\r\nann,5\r\n\r\nbob,9\r\n\nann,11\r\n",
+    "utf8_names": "name,score\nzoë,3\nzoe,4\nzoë,8\n",
+    "quoted": 'name,score\n"smith, ann",5\nbob,6\n',
+    "extra_column": "name,score\nann,5,x\nbob,6\n",
+    "spaces": "name,score\nann, 5\nbob,6\n",
+    "other_header": "score,name\n5,ann\n6,bob\n",
+    "header_only": "name,score\n",
+    "empty": "",
+}
+
+
+@pytest.mark.parametrize("case", sorted(MMAP_CASES))
+def test_calculate_high_scores_mmap_matches_csv(tmp_path, case):
+    input_path = tmp_path / "scores.csv"
+    input_path.write_bytes(MMAP_CASES[case].encode("utf-8"))
+
+    expected = calculate_high_scores(input_path, tmp_path / "csv.csv")
+    result = calculate_high_scores(input_path, tmp_path / "mmap.csv", engine="mmap")
+
+    assert list(result.items()) == list(expected.items())
+    assert (tmp_path / "mmap.csv").read_bytes() == (tmp_path / "csv.csv").read_bytes()
+
+
+def test_mmap_scan_splits_at_line_boundaries(tmp_path, monkeypatch):
+    input_path = tmp_path / "scores.csv"
+    rows = [(f"p{n % 7}", (n * 37) % 101 - 20) for n in range(500)]
+    input_path.write_text(
+        "name,score\n" + "".join(f"{n},{s}\n" for n, s in rows), encoding="utf-8"
+    )
+
+    expected = calculate_high_scores(input_path, tmp_path / "csv.csv")
+    monkeypatch.setattr(data_file_utils, "_high_scores_csv", None)  # no fallback
+    for max_workers in (1, 4):
+        result = data_file_utils._high_scores_mmap(
+            input_path, max_workers=max_workers, slice_bytes=100
+        )
+        assert list(result.items()) == list(expected.items())
+
+
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+@pytest.mark.parametrize("compression", sorted(COMPRESSORS))
+@pytest.mark.parametrize("engine", ["csv", "chunked", "mmap"])
+def test_calculate_high_scores_reads_compressed_input(tmp_path, compression, engine):
+    plain = tmp_path / "scores.csv"
+    rows = [(f"p{n % 11}", (n * 37) % 101 - 20) for n in range(300)]
+    _write_scores(plain, rows)
+    # Detected from the content, whatever the file is called
+    packed = tmp_path / "scores.log"
+    packed.write_bytes(COMPRESSORS[compression](plain.read_bytes()))
+
+    assert detect_compression(packed) == compression
+    assert detect_compression(plain) is None
+    with open_input(packed) as file:
+        assert file.readline() == "name,score,level\n"
+
+    expected = calculate_high_scores(plain, tmp_path / "plain.csv")
+    result = calculate_high_scores(packed, tmp_path / "packed.csv", engine=engine)
+    assert list(result.items()) == list(expected.items())
+
+
+def test_mmap_engine_streams_compressed_slices(tmp_path, monkeypatch):
+    packed = tmp_path / "scores.csv.gz"
+    rows = [(f"p{n % 7}", n % 50) for n in range(400)]
+    packed.write_bytes(
+        gzip.compress(
+            ("name,score\n" + "".join(f"{n},{s}\n" for n, s in rows)).encode()
+        )
+    )
+    expected = {f"p{n}": max(s for p, s in rows if p == f"p{n}") for n in range(7)}
+
+    monkeypatch.setattr(data_file_utils, "_high_scores_csv", None)  # no fallback
+    for max_workers in (1, 3):
+        result = data_file_utils._high_scores_mmap(
+            packed, max_workers=max_workers, slice_bytes=64
+        )
+        assert result == expected
+
+
+def test_compressed_shards_and_incremental_mode(tmp_path):
+    paths = []
+    for number, rows in enumerate([[("ann", 5)], [("bob", 7), ("ann", 9)]]):
+        paths.append(tmp_path / f"shard{number}.csv.xz")
+        body = "name,score\n" + "".join(f"{n},{s}\n" for n, s in rows)
+        paths[-1].write_bytes(lzma.compress(body.encode()))
+
+    result = calculate_high_scores_multi(paths, tmp_path / "out.csv", max_workers=2)
+    assert result == {"ann": 9, "bob": 7}
+    with pytest.raises(ValueError):
+        update_high_scores(paths[0], tmp_path / "out.csv", tmp_path / "state.json")
+
+
+def _make_files(directory, names):
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (directory / name).write_text(name, encoding="utf-8")
+
+
+MOVER_NAMES = ["a.png", "B.JPG", "c.txt", ".png", "d.", "e.tar.gif", "f"]
+
+
+def test_move_files_bulk_same_device(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_file_utils, "_MOVE_BATCH_SIZE", 2)
+    source, target = tmp_path / "src", tmp_path / "dst"
+    _make_files(source, MOVER_NAMES)
+    (source / "dir.png").mkdir()
+    target.mkdir()
+
+    progress = move_files_bulk(source, target, [".png", ".jpg", ".GIF"], max_workers=3)
+
+    assert sorted(os.listdir(target)) == ["B.JPG", "a.png", "e.tar.gif"]
+    assert sorted(os.listdir(source)) == [".png", "c.txt", "d.", "dir.png", "f"]
+    assert (target / "a.png").read_text(encoding="utf-8") == "a.png"
+    assert progress.snapshot() == {
+        "scanned": 8,
+        "matched": 3,
+        "moved": 3,
+        "bytes_copied": 0,
+        "hashed": 0,
+        "duplicates": 0,
+        "failed": 0,
+    }
+
+
+def test_move_files_bulk_dry_run_plans_without_moving(tmp_path):
+    source, target = tmp_path / "src", tmp_path / "dst"
+    _make_files(source, MOVER_NAMES)
+    target.mkdir()
+    progress = MoveProgress()
+
+    assert (
+        move_files_bulk(source, target, [".png"], dry_run=True, progress=progress)
+        is progress
+    )
+    assert progress.plan == [(str(source / "a.png"), str(target / "a.png"), "rename")]
+    assert progress.moved == 0
+    assert (source / "a.png").exists()
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/dev/shm")
+    or os.stat("/dev/shm").st_dev == os.stat(tempfile.gettempdir()).st_dev,
+    reason="needs a second filesystem",
+)
+def test_move_files_bulk_across_devices(tmp_path):
+    source = tmp_path / "src"
+    _make_files(source, MOVER_NAMES)
+    with tempfile.TemporaryDirectory(dir="/dev/shm") as target:
+        os.mkdir(os.path.join(target, "e.tar.gif"))  # can't be replaced by a file
+
+        progress = move_files_bulk(source, target, [".png", ".jpg", ".gif"])
+
+        assert sorted(os.listdir(target)) == ["B.JPG", "a.png", "e.tar.gif"]
+        assert open(os.path.join(target, "B.JPG"), encoding="utf-8").read() == "B.JPG"
+        assert progress.moved == 2 and progress.failed == 1
+        assert progress.bytes_copied == len("a.png") + len("B.JPG")
+        assert progress.errors[0][0] == str(source / "e.tar.gif")
+        assert sorted(os.listdir(source)) == [".png", "c.txt", "d.", "e.tar.gif", "f"]
+
+
+def _make_contents(directory, contents):
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, body in contents.items():
+        (directory / name).write_bytes(body)
+
+
+def test_move_files_bulk_dedupe_hardlink(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_file_utils, "_PARTIAL_HASH_BYTES", 4)
+    source, target = tmp_path / "src", tmp_path / "dst"
+    _make_contents(target, {"a.png": b"same-bytes-AAAA", "b.png": b"other-bytes-BBB"})
+    _make_contents(
+        source,
+        {
+            "a.png": b"same-bytes-AAAA",  # already stored under this name
+            "copy.png": b"same-bytes-AAAA",  # stored under another name
+            "b.png": b"different-size",  # name clash, different content
+            "x.png": b"same-head-tail-A",
+            "y.png": b"same-HEAD-tail-A",  # same size and partial hash as x
+        },
+    )
+
+    progress = move_files_bulk(source, target, [".png"], dedupe="hardlink")
+
+    assert os.listdir(source) == []
+    assert sorted(os.listdir(target)) == [
+        ".dedupe-index.json",
+        "a.png",
+        "b.png",
+        "b_1.png",
+        "copy.png",
+        "x.png",
+        "y.png",
+    ]
+    assert (target / "copy.png").stat().st_ino == (target / "a.png").stat().st_ino
+    assert (target / "b_1.png").read_bytes() == b"different-size"
+    assert (target / "y.png").read_bytes() == b"same-HEAD-tail-A"
+    assert progress.duplicates == 2 and progress.moved == 5 and progress.failed == 0
+
+    # A repeat run reuses the stored hashes: only the new file is hashed
+    # (partial, then full since its partial hash matches x and y)
+    _make_contents(source, {"again.png": b"same-head-tail-A"})
+    progress = move_files_bulk(source, target, [".png"], dedupe="hardlink")
+    assert progress.hashed == 2 and progress.duplicates == 1
+    assert (target / "again.png").stat().st_ino == (target / "x.png").stat().st_ino
+
+
+def test_move_files_bulk_dedupe_skip_and_dry_run(tmp_path):
+    source, target = tmp_path / "src", tmp_path / "dst"
+    _make_contents(target, {"kept.png": b"payload"})
+    _make_contents(source, {"dup.png": b"payload", "new.png": b"fresh!!"})
+    index_path = tmp_path / "hashes.json"
+
+    plan = move_files_bulk(
+        source, target, [".png"], dedupe="skip", dry_run=True, index_path=index_path
+    ).plan
+    assert sorted(plan) == [
+        (str(source / "dup.png"), str(target / "kept.png"), "skip"),
+        (str(source / "new.png"), str(target / "new.png"), "rename"),
+    ]
+    assert not index_path.exists()
+
+    move_files_bulk(source, target, [".png"], dedupe="skip", index_path=index_path)
+    assert os.listdir(source) == ["dup.png"]
+    assert sorted(os.listdir(target)) == ["kept.png", "new.png"]
+    index = json.loads(index_path.read_text())
+    assert sorted(index["files"]) == ["kept.png", "new.png"]
+    assert list(index["sources"]) == [str(source / "dup.png")]
+
+    # The skipped duplicate's hashes are reused while it is unchanged
+    rerun = move_files_bulk(
+        source, target, [".png"], dedupe="skip", index_path=index_path
+    )
+    assert rerun.hashed == 0 and rerun.duplicates == 1
+    (source / "dup.png").write_bytes(b"changed")
+    os.utime(source / "dup.png", ns=(10**9, 10**9))
+    rerun = move_files_bulk(
+        source, target, [".png"], dedupe="skip", index_path=index_path
+    )
+    assert rerun.hashed == 1 and rerun.duplicates == 0
+    assert os.listdir(source) == []
+
+    with pytest.raises(ValueError):
+        move_files_bulk(source, target, [".png"], dedupe="delete")
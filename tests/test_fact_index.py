@@ -0,0 +1,86 @@
+import pytest
+from src.fact_index import FactIndex, tokenize
+
+FACTS = [
+    "Cats sleep for 70% of their lives.",
+    "A group of cats is called a clowder.",
+    "Cats have five toes on their front paws, but only four on the back.",
+    "The oldest cat on record lived to be 38 years old.",
+    "A cat's nose print is unique, much like a human fingerprint.",
+]
+
+
+def test_tokenize():
+    assert tokenize("A cat's nose, 38 Years!") == [
+        "a",
+        "cat",
+        "s",
+        "nose",
+        "38",
+        "years",
+    ]
+
+
+def test_search_ranks_by_bm25():
+    index = FactIndex.from_facts(FACTS)
+    results = index.search("cats paws", k=3)
+
+    assert results[0][0] == FACTS[2]
+    assert all(score > 0 for _, score in results)
+    assert [score for _, score in results] == sorted(
+        (score for _, score in results), reverse=True
+    )
+    assert index.search("dog") == []
+
+
+def test_incremental_add():
+    index = FactIndex.from_facts(FACTS[:2])
+    assert index.search("fingerprint") == []
+
+    doc_id = index.add(FACTS[4])
+    assert doc_id == 2
+    assert index.search("fingerprint")[0][0] == FACTS[4]
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(tmp_path, mmap):
+    index = FactIndex.from_facts(FACTS[:3])
+    index.save(str(tmp_path))
+
+    loaded = FactIndex.load(str(tmp_path), mmap=mmap)
+    assert len(loaded) == 3
+    assert loaded.search("clowder") == index.search("clowder")
+
+    # Facts added after loading live in the delta segment until the next save
+    loaded.add_many(FACTS[3:])
+    expected = FactIndex.from_facts(FACTS).search("cat nose")
+    assert loaded.search("cat nose") == pytest.approx(expected)
+
+    loaded.save(str(tmp_path / "merged"))
+    merged = FactIndex.load(str(tmp_path / "merged"))
+    assert [merged.fact(i) for i in range(len(merged))] == FACTS
+    assert merged.search("cat nose") == pytest.approx(expected)
+
+
+def test_incremental_save_to_loaded_path(tmp_path):
+    FactIndex.from_facts(FACTS[:2]).save(str(tmp_path))
+
+    # Repeated load, add, save on one directory, querying between saves
+    for fact in FACTS[2:]:
+        index = FactIndex.load(str(tmp_path))
+        index.add(fact)
+        index.save(str(tmp_path))
+        assert len(index) == len(index._facts)
+        assert index.search("cats") == FactIndex.load(str(tmp_path)).search("cats")
+
+    expected = FactIndex.from_facts(FACTS).search("cat nose")
+    assert index.search("cat nose") == pytest.approx(expected)
+    assert FactIndex.load(str(tmp_path)).search("cat nose") == pytest.approx(expected)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_empty_index(tmp_path):
+    index = FactIndex()
+    assert index.search("cats") == []
+    index.save(str(tmp_path))
+    assert FactIndex.load(str(tmp_path)).search("cats") == []
@@ -0,0 +1,76 @@
+import pytest
+import requests
+from src import api_utils
+from src.fake_api_server import FakeApiServer
+
+
+@pytest.fixture
+def fake_api():
+    with FakeApiServer(seed=1, nasa_items=5, nasa_page_bytes=2000) as server:
+        with server.patch_module(api_utils):
+            api_utils.reset_circuit_breakers()
+            yield server
+    api_utils.close_session()
+    api_utils.reset_circuit_breakers()
+
+
+def test_fetchers_against_fake_server(fake_api):
+    setup, punchline = api_utils.get_joke()
+    assert setup and punchline
+
+    assert len(api_utils.get_dog_images(3)) == 3
+    assert api_utils.get_weather("Paris", "key")["name"] == "Paris"
+    assert api_utils.get_weather("Paris", "") is None
+
+    facts = api_utils.get_cat_facts(limit=5, page=2)
+    assert facts["data"][0]["fact"] == "Cat fact number 6."
+
+    prices = api_utils.get_crypto_prices(["bitcoin", "ethereum"])
+    assert set(prices) == {"bitcoin", "ethereum"}
+    assert prices == api_utils.get_crypto_prices(["bitcoin", "ethereum"])
+
+
+def test_collect_and_scrape_against_fake_server(fake_api):
+    fake_api.cat_fact_total = 23
+    facts = api_utils.collect_cat_facts_dataset(100, requests_per_second=1000)
+    assert len(facts) == 23
+
+    records = api_utils.nasa_image_search("moon", limit=3, per_host_rate=1000)
+    assert [r["description"] for r in records] == [
+        f"Description of id{n}" for n in range(3)
+    ]
+
+
+def test_large_dog_image_counts_are_chunked(fake_api):
+    images = api_utils.get_dog_images(500)
+    assert len(images) == len(set(images)) == 500
+    assert fake_api.request_counts["/api/breeds/image/random/50"] == 10
+
+
+def test_error_rate_and_request_counts(fake_api):
+    fake_api.error_rate = 1.0
+    response = requests.get(fake_api.api_urls()["CAT_FACTS_API_URL"], timeout=5)
+    assert response.status_code == 503
+    assert fake_api.request_counts["/facts"] == 1
+
+
+def test_etag_revalidation(fake_api):
+    url = fake_api.api_urls()["WEATHER_API_URL"]
+    params = {"q": "Oslo", "appid": "key"}
+    first = requests.get(url, params=params, timeout=5)
+    second = requests.get(
+        url, params=params, headers={"If-None-Match": first.headers["ETag"]}, timeout=5
+    )
+    assert second.status_code == 304
+
+
+def test_patch_module_restores_urls():
+    original = api_utils.CAT_FACTS_API_URL
+    with FakeApiServer() as server, server.patch_module(api_utils):
+        assert api_utils.CAT_FACTS_API_URL.startswith(server.url)
+    assert api_utils.CAT_FACTS_API_URL == original
+
+
+def test_invalid_error_rate():
+    with pytest.raises(ValueError):
+        FakeApiServer(error_rate=2)
@@ -0,0 +1,61 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative import time allowed for each module, in seconds
+IMPORT_BUDGET = 0.15
+# Cold imports timed per module; the fastest counts, so a busy CI runner
+# does not fail the budget on one slow run
+IMPORT_RUNS = 3
+HEAVY_MODULES = ["requests", "urllib3", "asyncio", "ssl", "numpy", "pandas", "bs4"]
+HEAVY_MODULES += ["matplotlib", "matplotlib.pyplot"]
+
+_PROBE = """
+import json, sys
+heavy = json.loads(sys.argv[2])
+__import__(sys.argv[1])
+print(json.dumps([name for name in heavy if name in sys.modules]))
+"""
+
+
+def _import_in_fresh_interpreter(module):
+    """(cumulative import seconds, heavy modules loaded) for a cold import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, module]
+        + [json.dumps(HEAVY_MODULES)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative_us = int(fields[1])
+    return cumulative_us / 1e6, json.loads(result.stdout)
+
+
+@pytest.mark.parametrize(
+    "module", ["src.api_utils", "src.visualization", "src.nb_data_utils"]
+)
+def test_import_stays_lazy_and_within_budget(module):
+    runs = [_import_in_fresh_interpreter(module) for _ in range(IMPORT_RUNS)]
+    assert all(loaded == [] for _, loaded in runs)
+    assert 0 < min(seconds for seconds, _ in runs) < IMPORT_BUDGET
+
+
+def test_lazy_requests_loads_on_first_use():
+    from src import api_utils
+
+    assert issubclass(
+        api_utils.CircuitOpenError, api_utils.requests.exceptions.RequestException
+    )
+    assert api_utils.get_session().adapters["https://"].__class__.__name__ == (
+        "_TimedHTTPAdapter"
+    )
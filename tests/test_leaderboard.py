@@ -0,0 +1,74 @@
+import pytest
+from src.leaderboard import Leaderboard
+
+ROWS = [
+    ("ann", 5),
+    ("bob", 9),
+    ("cy", 9),
+    ("ann", 12),
+    ("dee", -4),
+    ("ann", 7),
+    ("bob", 3),
+    ("ann", 1),
+]
+
+
+def test_top_scores_and_rank():
+    board = Leaderboard(k=2)
+    board.add_many(ROWS)
+
+    assert len(board) == 4
+    assert board.top(3) == [("ann", 12), ("bob", 9), ("cy", 9)]
+    assert board.top(100)[-1] == ("dee", -4)
+    assert board.scores("ann") == [12, 7]
+    assert board.best("bob") == 9
+    assert [board.rank(p) for p in ("ann", "bob", "cy", "dee")] == [1, 2, 2, 4]
+    assert "eve" not in board
+    with pytest.raises(KeyError):
+        board.rank("eve")
+
+
+def test_from_csv_save_and_load(tmp_path):
+    scores = tmp_path / "scores.csv"
+    scores.write_text(
+        "name,score\n" + "".join(f"{n},{s}\n" for n, s in ROWS), encoding="utf-8"
+    )
+    board = Leaderboard.from_csv(scores, k=3)
+    board.save(tmp_path / "board")
+
+    loaded = Leaderboard.load(tmp_path / "board")
+    assert loaded.top(4) == board.top(4)
+    assert loaded.scores("ann") == [12, 7, 5]
+    assert loaded.rank("cy") == 2
+
+    # A loaded leaderboard keeps accepting scores
+    loaded.add("dee", 20)
+    loaded.add("ann", 6)
+    assert loaded.top(2) == [("dee", 20), ("ann", 12)]
+    assert loaded.scores("ann") == [12, 7, 6]
+    assert loaded.rank("ann") == 2
+
+
+def test_save_back_to_loaded_path(tmp_path):
+    board = Leaderboard(k=3)
+    board.add_many((f"p{i:04d}", i % 97) for i in range(3000))
+    board.save(tmp_path)
+
+    Leaderboard.load(tmp_path).save(tmp_path)
+    loaded = Leaderboard.load(tmp_path)
+    assert loaded.top(5) == board.top(5)
+    assert loaded.rank("p0096") == board.rank("p0096")
+
+    loaded.add("new", 1000)
+    loaded.save(tmp_path)
+    assert Leaderboard.load(tmp_path).top(1) == [("new", 1000)]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_empty_leaderboard(tmp_path):
+    board = Leaderboard()
+    assert board.top() == []
+    board.save(tmp_path / "empty")
+    assert len(Leaderboard.load(tmp_path / "empty")) == 0
+    with pytest.raises(ValueError):
+        Leaderboard(k=0)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from datetime import datetime, timezone
+from src.price_store import PriceStore, to_epoch_ns
+
+T0 = 1_700_000_000 * 10**9
+
+
+def test_to_epoch_ns():
+    moment = datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+    assert to_epoch_ns(moment) == T0
+    assert to_epoch_ns(T0) == T0
+    assert to_epoch_ns("2023-11-14T22:13:20+00:00") == T0
+
+
+def test_append_grows_and_slices():
+    store = PriceStore(["bitcoin", "ethereum"], initial_capacity=2)
+    for i in range(10):
+        store.append({"bitcoin": 100.0 + i, "ethereum": None}, T0 + i * 10**9)
+
+    assert len(store) == 10
+    assert store.bytes_per_tick == 24
+    assert store.prices("bitcoin")[-1] == 109.0
+    assert np.isnan(store.prices("ethereum")).all()
+
+    timestamps, prices = store.slice(T0 + 3 * 10**9, T0 + 6 * 10**9)
+    assert list(prices["bitcoin"]) == [103.0, 104.0, 105.0]
+    assert timestamps[0] == T0 + 3 * 10**9
+
+
+def test_rejects_out_of_order_ticks():
+    store = PriceStore(["bitcoin"])
+    store.append({"bitcoin": 1.0}, T0)
+    with pytest.raises(ValueError):
+        store.append({"bitcoin": 2.0}, T0 - 1)
+
+
+def test_to_dataframe_shares_buffers():
+    store = PriceStore(["bitcoin"])
+    store.append({"bitcoin": 1.5}, T0)
+    store.append({"bitcoin": 2.5}, T0 + 10**9)
+
+    df = store.to_dataframe()
+    assert list(df["bitcoin"]) == [1.5, 2.5]
+    assert str(df.index.tz) == "UTC"
+    assert str(df.index[0]) == "2023-11-14 22:13:20+00:00"
+    assert np.shares_memory(df["bitcoin"].to_numpy(), store.prices("bitcoin"))
+    assert np.shares_memory(df.index.asi8, store.timestamps)
+
+    # Timestamps taken from the frame slice back to the same rows
+    second = df.index[1].to_pydatetime()
+    assert list(store.to_dataframe(start=second)["bitcoin"]) == [2.5]
+    assert list(store.to_dataframe(start=str(df.index[1]))["bitcoin"]) == [2.5]
+
+
+def test_append_record_from_tracker():
+    store = PriceStore(["bitcoin", "ethereum"])
+    store.append_record(
+        {"timestamp": "2024-01-02 03:04:05", "bitcoin_usd": 42.0, "ethereum_usd": None}
+    )
+    assert store.prices("bitcoin")[0] == 42.0
+    assert store.timestamps[0] == to_epoch_ns(datetime(2024, 1, 2, 3, 4, 5))
+
+
+def test_memory_mapped_persistence(tmp_path):
+    with PriceStore(["bitcoin"], path=str(tmp_path), initial_capacity=4) as store:
+        for i in range(9):
+            store.append({"bitcoin": float(i)}, T0 + i)
+
+    reopened = PriceStore(path=str(tmp_path))
+    assert reopened.coins == ["bitcoin"]
+    assert list(reopened.prices("bitcoin")) == [float(i) for i in range(9)]
+    assert isinstance(reopened.timestamps.base, np.memmap) or isinstance(
+        reopened.timestamps, np.memmap
+    )
+
+    reopened.append({"bitcoin": 9.0}, T0 + 9)
+    reopened.flush()
+    assert len(PriceStore(path=str(tmp_path))) == 10
+
+    with pytest.raises(ValueError):
+        PriceStore(["ethereum"], path=str(tmp_path))
+
+
+def test_new_store_requires_coins():
+    with pytest.raises(ValueError):
+        PriceStore()